@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Measures how compute_all scales with the number of worker processes.
+
+Only the pair counting is spread across workers. Encoding the articles and
+building the aggregates from the merged counts run serially in this process,
+so the speedup cannot exceed (time with one worker) / (serial time); that cap
+is printed first.
+
+Run with: python -m lib.benchmarks.analytics [article_count]
+"""
+import os
+import sys
+import time
+
+from lib.classes.analytics import compute_all, count_pairs, encode
+from lib.classes.many_to_many import Article, Author, Magazine
+
+
+def build_graph(article_count, author_count=50_000, magazine_count=1_000):
+    authors = [Author(f"Author {i}") for i in range(author_count)]
+    magazines = [Magazine(f"Magazine {i}", f"Category {i % 20}") for i in range(magazine_count)]
+    Article.from_records(
+        (authors[(i * 7919) % author_count], magazines[i % magazine_count], f"Article number {i}")
+        for i in range(article_count)
+    )
+    return authors, magazines
+
+
+def run(article_count):
+    authors, magazines = build_graph(article_count)
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+
+    print(f"{article_count} articles, {cores} cores")
+    author_ids, magazine_ids = encode(authors, magazines)
+    start = time.perf_counter()
+    count_pairs(author_ids, magazine_ids, workers=1)
+    count_seconds = time.perf_counter() - start
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        compute_all(authors, magazines, workers=workers)
+        seconds = time.perf_counter() - start
+        if baseline is None:
+            baseline = seconds
+            serial = max(seconds - count_seconds, 1e-9)
+            print(f"  serial part: {serial:.2f}s of {seconds:.2f}s, so at most {seconds / serial:.2f}x")
+        print(f"  {workers:>3} workers: {seconds:.2f}s ({baseline / seconds:.2f}x)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
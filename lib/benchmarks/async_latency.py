@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Measures AsyncCatalog request latency under many concurrent requests.
+
+Run with: python -m lib.benchmarks.async_latency [concurrency] [rounds]
+"""
+import asyncio
+import sys
+import time
+
+from lib.classes.async_catalog import AsyncCatalog
+from lib.classes.many_to_many import Author, Magazine
+
+
+async def timed(call):
+    start = time.perf_counter()
+    await call
+    return time.perf_counter() - start
+
+
+async def run(concurrency, rounds):
+    catalog = AsyncCatalog()
+    authors = [Author(f"Author {i}") for i in range(100)]
+    magazines = [Magazine(f"Magazine {i}", f"Category {i % 10}") for i in range(50)]
+
+    write_latencies, read_latencies = [], []
+    for round_number in range(rounds):
+        requests = []
+        for i in range(concurrency):
+            if i % 2:
+                requests.append(timed(catalog.contributors(magazines[i % 50])))
+            else:
+                title = f"Article {round_number}-{i}"
+                requests.append(timed(catalog.add_article(authors[i % 100], magazines[i % 50], title)))
+        latencies = await asyncio.gather(*requests)
+        write_latencies.extend(latencies[0::2])
+        read_latencies.extend(latencies[1::2])
+
+    for name, latencies in (("add_article", write_latencies), ("contributors", read_latencies)):
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[int(len(latencies) * 0.99)] * 1000
+        print(f"  {name:<13} p50 {p50:.2f}ms  p99 {p99:.2f}ms")
+
+
+if __name__ == "__main__":
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    print(f"{concurrency} concurrent requests x {rounds} rounds")
+    asyncio.run(run(concurrency, rounds))
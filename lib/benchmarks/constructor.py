@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Times Article construction and the Article property setters, in nanoseconds per call.
+
+Run with: python -m lib.benchmarks.constructor [repeat_count]
+"""
+import sys
+import timeit
+
+from lib.classes.many_to_many import Article, Author, Catalog, Magazine
+
+TITLE = "Article number 1"
+
+
+def cases():
+    """Returns (name, callable, rows per call) for every operation measured"""
+    # A separate catalog keeps the benchmark's instances out of the default one
+    with Catalog():
+        authors = [Author("Author 1"), Author("Author 2")]
+        magazines = [Magazine("Magazine 1", "Category 1"), Magazine("Magazine 2", "Category 2")]
+        # The setters move the article between lists, so keep it apart from the
+        # lists that grow with every construction
+        article = Article(Author("Author 3"), Magazine("Magazine 3", "Category 3"), TITLE)
+        others = [article.author, Author("Author 4")], [article.magazine, Magazine("Magazine 4", "Category 4")]
+    records = [(authors[0], magazines[0], TITLE)] * 1000
+
+    def construct():
+        Article(authors[0], magazines[0], TITLE)
+
+    def from_records():
+        Article.from_records(records)
+
+    flip = [0]
+
+    def set_author():
+        flip[0] ^= 1
+        article.author = others[0][flip[0]]
+
+    def set_magazine():
+        flip[0] ^= 1
+        article.magazine = others[1][flip[0]]
+
+    def set_title():
+        try:
+            article.title = TITLE
+        except AttributeError:
+            pass
+
+    return [
+        ("Article()", construct, 1),
+        ("from_records (per row)", from_records, len(records)),
+        ("author setter", set_author, 1),
+        ("magazine setter", set_magazine, 1),
+        ("title setter (rejected)", set_title, 1),
+        ("title getter", lambda: article.title, 1),
+    ]
+
+
+def run(repeat_count):
+    for name, operation, rows in cases():
+        number = max(1, 20_000 // rows)
+        best = min(timeit.repeat(operation, number=number, repeat=repeat_count))
+        print(f"{name:>24}: {best / (number * rows) * 1e9:,.0f} ns")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Compares AdjacencyIndex queries with nested loops over the model, on a
+synthetic graph where author output and magazine popularity follow power laws.
+
+Run with: python -m lib.benchmarks.graph [article_count]
+"""
+import random
+import sys
+import time
+from collections import Counter
+
+from lib.benchmarks.workload import build_records
+from lib.classes.graph import AdjacencyIndex
+from lib.classes.many_to_many import Article, Author, Catalog, Magazine
+
+
+def naive_co_authors(author):
+    counts = Counter()
+    for magazine in author.magazines():
+        counts.update(magazine.contributors())
+    counts.pop(author, None)
+    return counts.most_common()
+
+
+def naive_overlap(magazine):
+    counts = Counter()
+    for author in magazine.contributors():
+        counts.update(author.magazines())
+    counts.pop(magazine, None)
+    return counts.most_common()
+
+
+def naive_reachable_categories(author):
+    categories = {}
+    for magazine in author.magazines():
+        for contributor in magazine.contributors():
+            for reached in contributor.magazines():
+                categories[reached.category] = None
+    return tuple(categories)
+
+
+def timed(function, arguments):
+    """Returns the mean time of function over arguments in milliseconds"""
+    start = time.perf_counter()
+    for argument in arguments:
+        function(argument)
+    return (time.perf_counter() - start) / len(arguments) * 1000
+
+
+def run(article_count):
+    with Catalog() as catalog:
+        authors = [Author(f"Author {i}") for i in range(article_count // 20)]
+        magazines = [Magazine(f"Magazine {i}", f"Category {i % 50}") for i in range(max(article_count // 200, 2))]
+        records = build_records(article_count, authors, magazines)
+
+        start = time.perf_counter()
+        Article.from_records(records)
+        plain_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = AdjacencyIndex(catalog)
+        replay_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        Article.from_records(records[: article_count // 10])
+        followed_seconds = time.perf_counter() - start
+
+    print(f"{article_count} articles, {len(authors)} authors, {len(magazines)} magazines")
+    print(f"  load without index: {article_count / plain_seconds:,.0f} articles/s")
+    print(f"  load with index:    {article_count // 10 / followed_seconds:,.0f} articles/s")
+    print(f"  index build:        {replay_seconds:.2f} s")
+
+    generator = random.Random(1)
+    sample_authors = authors[:5] + generator.sample(authors, 45)
+    sample_magazines = magazines[:5] + generator.sample(magazines, 15)
+    comparisons = [
+        ("co-authors", naive_co_authors, index.co_authors, sample_authors),
+        ("magazine overlap", naive_overlap, index.overlapping_magazines, sample_magazines),
+        ("two-hop categories", naive_reachable_categories, index.reachable_categories, sample_authors),
+    ]
+    for name, naive, indexed, arguments in comparisons:
+        print(f"  {name:>20}: {timed(naive, arguments):9.3f} ms nested loops, {timed(indexed, arguments):9.3f} ms indexed")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Measures how long it takes to import the lib package and each optional
+subsystem, using python -X importtime in a fresh interpreter.
+
+Each import runs once first to write the bytecode cache, and then the best of
+repeat runs is kept. The interpreter's own startup imports (site, encodings)
+are excluded. Times are cumulative, so they include every module that an
+import pulls in.
+
+Run with:
+    python -m lib.benchmarks.import_time
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MODULES = (
+    "lib.classes",
+    "lib.classes.many_to_many",
+    "lib.classes.analytics",
+    "lib.classes.async_catalog",
+    "lib.classes.changes",
+    "lib.classes.graph",
+    "lib.classes.instrumentation",
+    "lib.classes.search",
+    "lib.classes.serialization",
+    "lib.classes.snapshot",
+    "lib.classes.sqlite_backend",
+    "lib.classes.vectorized",
+)
+
+
+def import_times(module):
+    """Imports module in a fresh interpreter and returns {imported module:
+    cumulative microseconds} for every module it loaded"""
+    environment = dict(os.environ, PYTHONPATH=ROOT)
+    # Without a bytecode cache every import would mostly time the compiler
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    baseline = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"], env=environment, capture_output=True, text=True, check=True
+    )
+    startup = set(_parse(baseline.stderr))
+    return {name: micros for name, micros in _parse(completed.stderr).items() if name not in startup}
+
+
+def _parse(output):
+    # Lines look like "import time:       123 |       456 |   package.module"
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(module, repeat=5):
+    """Returns (cumulative microseconds, modules loaded) for the fastest of repeat imports"""
+    import_times(module)  # writes the bytecode cache
+    best = None
+    for _ in range(repeat):
+        times = import_times(module)
+        if best is None or times[module] < best[module]:
+            best = times
+    return best[module], sorted(best)
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5, help="imports per module; the fastest is kept")
+    options = parser.parse_args(arguments)
+
+    for module in MODULES:
+        micros, loaded = measure(module, options.repeat)
+        print(f"{module:>30}: {micros / 1000:8.2f} ms  ({len(loaded)} modules)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Measures streaming load and export throughput in rows per second.
+
+Run with: python -m lib.benchmarks.loader [row_count] [csv|jsonl]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from lib.classes.serialization import FIELDS, export, load
+
+
+def write_rows(path, row_count, format, author_count=100_000, magazine_count=1_000):
+    """Writes row_count generated records without holding them in memory"""
+    with open(path, "w", encoding="utf-8") as file:
+        if format == "csv":
+            file.write(",".join(FIELDS) + "\n")
+        for i in range(row_count):
+            row = (f"Author {i % author_count}", f"Magazine {i % magazine_count}", f"Category {i % 20}", f"Article number {i}")
+            if format == "csv":
+                file.write(",".join(row) + "\n")
+            else:
+                file.write(json.dumps(dict(zip(FIELDS, row))) + "\n")
+
+
+def run(row_count, format):
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, f"source.{format}")
+        target = os.path.join(directory, f"target.{format}")
+        write_rows(source, row_count, format)
+
+        start = time.perf_counter()
+        authors, _ = load(source)
+        load_seconds = time.perf_counter() - start
+
+        articles = (article for author in authors.values() for article in author.articles())
+        start = time.perf_counter()
+        export(articles, target)
+        export_seconds = time.perf_counter() - start
+
+    print(f"{row_count} {format} rows")
+    print(f"  load:   {row_count / load_seconds:,.0f} rows/s")
+    print(f"  export: {row_count / export_seconds:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    run(count, sys.argv[2] if len(sys.argv) > 2 else "csv")
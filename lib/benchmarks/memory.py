@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Measures how many bytes each Article costs once it is linked into the graph.
+
+Run with: python -m lib.benchmarks.memory [article_count]
+"""
+import sys
+import tracemalloc
+
+from lib.classes.many_to_many import Article, Author, Magazine
+
+
+def build_graph(article_count, author_count=1000, magazine_count=100):
+    """Creates article_count articles spread evenly over the authors and magazines"""
+    authors = [Author(f"Author {i}") for i in range(author_count)]
+    magazines = [Magazine(f"Magazine {i}", f"Category {i % 10}") for i in range(magazine_count)]
+    articles = []
+    for i in range(article_count):
+        articles.append(
+            Article(authors[i % author_count], magazines[i % magazine_count], f"Article number {i}")
+        )
+    return authors, magazines, articles
+
+
+def bytes_per_article(article_count):
+    """Returns the traced allocation per article, excluding the title strings themselves"""
+    titles_size = sum(sys.getsizeof(f"Article number {i}") for i in range(article_count))
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    graph = build_graph(article_count)
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del graph
+    return (used - titles_size) / article_count
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{count} articles: {bytes_per_article(count):.1f} bytes per article (excluding titles)")
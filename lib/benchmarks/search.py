@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Measures title index build rate, query latency and file size.
+
+Titles are drawn from a vocabulary with Zipf-like word frequencies, so some
+words appear in a large share of articles and most are rare.
+
+Run with: python -m lib.benchmarks.search [article_count]
+"""
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+
+from lib.classes.many_to_many import Article, Author, Catalog, Magazine
+from lib.classes.search import TitleIndex
+
+VOCABULARY = [f"w{rank}" for rank in range(50_000)]
+CUMULATIVE_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+
+
+def titles(count, seed=0):
+    """Yields count titles of four to seven words"""
+    generator = random.Random(seed)
+    for _ in range(count):
+        yield " ".join(generator.choices(VOCABULARY, cum_weights=CUMULATIVE_WEIGHTS, k=generator.randint(4, 7)))
+
+
+def timed(function, repeat=20):
+    """Returns (the result of function(), best time in milliseconds)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+
+def run(article_count):
+    with Catalog():
+        authors = [Author(f"Author {i}") for i in range(1000)]
+        magazines = [Magazine(f"Magazine {i}", f"Category {i % 10}") for i in range(100)]
+        Article.from_records(
+            (authors[i % len(authors)], magazines[i % len(magazines)], title)
+            for i, title in enumerate(titles(article_count))
+        )
+
+        start = time.perf_counter()
+        index = TitleIndex()
+        build_seconds = time.perf_counter() - start
+        print(f"{article_count} articles, {len(index._postings)} distinct words")
+        print(f"  build: {article_count / build_seconds:,.0f} articles/s")
+
+        queries = [
+            ("common word, first 20", lambda: index.search("w0", limit=20)),
+            ("rare word, all", lambda: index.search("w40000")),
+            ("common AND rare, all", lambda: index.search("w0 w30000")),
+            ("two common words, first 20", lambda: index.search("w1 w2", limit=20)),
+            ("prefix, first 20", lambda: index.search_prefix("w1 w123", limit=20)),
+            ("phrase, first 20", lambda: index.search_phrase("w0 w1", limit=20)),
+            ("rare word ranked by magazine", lambda: TitleIndex.rank(index.search("w20000"))),
+        ]
+        for name, query in queries:
+            result, milliseconds = timed(query)
+            print(f"  {name:>30}: {milliseconds:8.3f} ms ({len(result)} results)")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "titles.idx")
+            index.save(path)
+            size = os.path.getsize(path)
+            articles = index.articles()
+            start = time.perf_counter()
+            TitleIndex.load(path, articles)
+            load_seconds = time.perf_counter() - start
+        print(f"  file: {size / article_count:.1f} bytes per article, loaded in {load_seconds:.2f} s")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Measures snapshot save time and cold-start reload time.
+
+Run with: python -m lib.benchmarks.snapshot [article_count]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from lib.classes.many_to_many import Article, Author, Magazine
+from lib.classes.snapshot import Snapshot, save
+
+
+def build_graph(article_count, author_count=100_000, magazine_count=1_000):
+    authors = [Author(f"Author {i}") for i in range(author_count)]
+    magazines = [Magazine(f"Magazine {i}", f"Category {i % 20}") for i in range(magazine_count)]
+    Article.from_records(
+        (authors[i % author_count], magazines[i % magazine_count], f"Article number {i}")
+        for i in range(article_count)
+    )
+    return authors, magazines
+
+
+def run(article_count):
+    authors, magazines = build_graph(article_count)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.snap")
+
+        start = time.perf_counter()
+        save(path, authors, magazines)
+        save_seconds = time.perf_counter() - start
+        size = os.path.getsize(path)
+
+        start = time.perf_counter()
+        snapshot = Snapshot(path)
+        snapshot.author(0).articles()
+        snapshot.magazine(0).contributors()
+        reload_seconds = time.perf_counter() - start
+        snapshot.close()
+
+    print(f"{article_count} articles, {size / 2**20:.1f} MiB snapshot")
+    print(f"  save:                  {save_seconds:.2f}s")
+    print(f"  reload + first query:  {reload_seconds * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Compares each query method in memory and through the SQLite backend.
+
+Run with: python -m lib.benchmarks.sqlite [article_count]
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+from lib.classes.many_to_many import Article, Author, Magazine
+from lib.classes.sqlite_backend import SQLiteCatalog
+
+
+def build_graph(article_count, author_count=1_000, magazine_count=100):
+    authors = [Author(f"Author {i}") for i in range(author_count)]
+    magazines = [Magazine(f"Magazine {i}", f"Category {i % 10}") for i in range(magazine_count)]
+    Article.from_records(
+        (authors[(i * 7) % author_count], magazines[i % magazine_count], f"Article number {i}")
+        for i in range(article_count)
+    )
+    return authors, magazines
+
+
+def queries(author, magazine, top_publisher):
+    # Model and stored records share these method names
+    return {
+        "author.articles": author.articles,
+        "author.magazines": author.magazines,
+        "author.topic_areas": author.topic_areas,
+        "magazine.articles": magazine.articles,
+        "magazine.contributors": magazine.contributors,
+        "magazine.article_titles": magazine.article_titles,
+        "magazine.contributing_authors": magazine.contributing_authors,
+        "top_publisher": top_publisher,
+    }
+
+
+def run(article_count, number=200):
+    authors, magazines = build_graph(article_count)
+    with tempfile.TemporaryDirectory() as directory:
+        with SQLiteCatalog(os.path.join(directory, "articles.db")) as catalog:
+            stored = catalog.save(authors, magazines)
+            memory = queries(authors[0], magazines[0], Magazine.top_publisher)
+            sqlite = queries(stored[authors[0]], stored[magazines[0]], catalog.top_publisher)
+
+            print(f"{article_count} articles, microseconds per call")
+            print(f"  {'query':<30}{'memory':>12}{'sqlite':>12}")
+            for name in memory:
+                memory_us = timeit.timeit(memory[name], number=number) / number * 1e6
+                sqlite_us = timeit.timeit(sqlite[name], number=number) / number * 1e6
+                print(f"  {name:<30}{memory_us:>12.1f}{sqlite_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Times the public Author and Magazine methods across data sizes, reports
+memory per article, and compares the results with a stored baseline.
+
+Each size gets a fresh synthetic workload (see workload.py) in its own catalog.
+Derived views are cached, so they are timed both cold, with the cache cleared
+before each call, and warm. Baselines are only comparable on the machine and
+Python version that recorded them.
+
+Run with:
+    python -m lib.benchmarks.suite --save       # record a baseline
+    python -m lib.benchmarks.suite --check      # exit with status 1 on a regression
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from lib.benchmarks.workload import build
+from lib.classes.many_to_many import Catalog, Magazine
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def _time(call, instances, cold, repeat):
+    # Best per-call time over repeat passes, in nanoseconds
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for instance in instances:
+            if cold:
+                instance._invalidate()
+            call(instance)
+        best = min(best, time.perf_counter() - start)
+    return best / len(instances) * 1e9
+
+
+def _sample(generator, population, size, top=10):
+    rest = population[top:]
+    return population[:top] + generator.sample(rest, max(0, min(size - top, len(rest))))
+
+
+def measure(size, repeat=5, sample_size=200, seed=0):
+    """Returns {metric: value} for a workload of size articles. Times are in
+    nanoseconds per call and memory is in bytes per article"""
+    results = {}
+    with Catalog():
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        authors, magazines = build(size, seed=seed)
+        results["memory with titles (bytes/article)"] = (tracemalloc.get_traced_memory()[0] - baseline) / size
+        tracemalloc.stop()
+
+        # The most prolific authors and most popular magazines, plus a random sample of the rest
+        generator = random.Random(seed)
+        sample_authors = _sample(generator, authors, sample_size)
+        sample_magazines = _sample(generator, magazines, sample_size)
+
+        cases = [
+            ("Author.magazines", sample_authors, lambda author: author.magazines()),
+            ("Author.topic_areas", sample_authors, lambda author: author.topic_areas()),
+            ("Magazine.contributors", sample_magazines, lambda magazine: magazine.contributors()),
+            ("Magazine.article_titles", sample_magazines, lambda magazine: magazine.article_titles()),
+            ("Magazine.contributing_authors", sample_magazines, lambda magazine: magazine.contributing_authors()),
+        ]
+        for name, instances, call in cases:
+            results[f"{name} cold (ns)"] = _time(call, instances, True, repeat)
+            results[f"{name} warm (ns)"] = _time(call, instances, False, repeat)
+        results["Magazine.top_publisher (ns)"] = _time(lambda _: Magazine.top_publisher(), range(1000), False, repeat)
+
+        titles = iter(range(sys.maxsize))
+        pairs = list(zip(sample_authors, sample_magazines * (len(sample_authors) // len(sample_magazines) + 1)))
+        results["Author.add_article (ns)"] = _time(
+            lambda pair: pair[0].add_article(pair[1], f"Benchmark article {next(titles)}"), pairs, False, repeat
+        )
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Returns (size, metric, baseline value, current value) for every metric that is
+    more than tolerance (a fraction) worse than its baseline"""
+    regressions = []
+    for size, metrics in results.items():
+        for metric, value in metrics.items():
+            previous = baseline.get(size, {}).get(metric)
+            if previous and value > previous * (1 + tolerance):
+                regressions.append((size, metric, previous, value))
+    return regressions
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000], help="articles per workload")
+    parser.add_argument("--repeat", type=int, default=5, help="passes per measurement; the best is kept")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline file")
+    parser.add_argument("--save", action="store_true", help="store the results as the baseline")
+    parser.add_argument("--check", action="store_true", help="fail if a result regressed past the tolerance")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, as a fraction")
+    options = parser.parse_args(arguments)
+
+    results = {}
+    for size in options.sizes:
+        results[str(size)] = measure(size, options.repeat)
+        print(f"{size} articles")
+        for metric, value in results[str(size)].items():
+            print(f"  {metric:>40}: {value:12,.1f}")
+
+    status = 0
+    if options.check:
+        if not os.path.exists(options.baseline):
+            print(f"No baseline at {options.baseline}; record one with --save")
+            return 1
+        with open(options.baseline, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), options.tolerance)
+        for size, metric, previous, value in regressions:
+            print(f"REGRESSION {size} articles, {metric}: {previous:,.1f} -> {value:,.1f}")
+        if regressions:
+            status = 1
+        else:
+            print(f"No regressions beyond {options.tolerance:.0%}")
+    if options.save:
+        with open(options.baseline, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"Baseline saved to {options.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""Reproducible synthetic workloads for the benchmarks.
+
+Authors and magazines are drawn from Zipf distributions, so a few authors
+write most of the articles and a few magazines attract most contributors.
+The same seed always produces the same graph.
+"""
+import itertools
+import random
+
+from lib.classes.many_to_many import Article, Author, Magazine
+
+
+def zipf_weights(count, exponent=1.1):
+    """Returns cumulative weights for random.choices, where rank r has weight 1 / r ** exponent"""
+    return list(itertools.accumulate(1 / (rank + 1) ** exponent for rank in range(count)))
+
+
+def build_records(article_count, authors, magazines, author_skew=1.1, magazine_skew=1.1, seed=0):
+    """Returns (author, magazine, title) records. author_skew shapes articles per author and
+    magazine_skew shapes authors per magazine; 0 spreads articles evenly"""
+    generator = random.Random(seed)
+    chosen_authors = generator.choices(authors, cum_weights=zipf_weights(len(authors), author_skew), k=article_count)
+    chosen_magazines = generator.choices(
+        magazines, cum_weights=zipf_weights(len(magazines), magazine_skew), k=article_count
+    )
+    return [
+        (author, magazine, f"Article number {index}")
+        for index, (author, magazine) in enumerate(zip(chosen_authors, chosen_magazines))
+    ]
+
+
+def build(article_count, author_count=None, magazine_count=None, category_count=20, **skew):
+    """Creates authors, magazines and article_count articles in the current catalog.
+    Returns the (authors, magazines) lists, most prolific and most popular first"""
+    author_count = author_count or max(article_count // 20, 1)
+    magazine_count = magazine_count or max(article_count // 200, 2)
+    authors = [Author(f"Author {i}") for i in range(author_count)]
+    magazines = [Magazine(f"Magazine {i}", f"Category {i % category_count}") for i in range(magazine_count)]
+    Article.from_records(build_records(article_count, authors, magazines, **skew))
+    return authors, magazines
@@ -0,0 +1,70 @@
+"""The Author/Magazine/Article model and its optional subsystems.
+
+The model is imported eagerly. Engines, indexes, backends and tools are
+imported the first time one of their names is looked up on this package. A
+worker process that only uses the model therefore never loads asyncio,
+sqlite3, numpy or the process pool machinery.
+"""
+import importlib
+
+from .many_to_many import (
+    Article,
+    Author,
+    BulkValidationError,
+    Catalog,
+    CatalogListener,
+    Magazine,
+    current_catalog,
+)
+
+# Public name -> submodule that defines it, imported on first use
+_LAZY = {
+    "AdjacencyIndex": "graph",
+    "Analytics": "analytics",
+    "AsyncCatalog": "async_catalog",
+    "ChangeFeed": "changes",
+    "ChangesDropped": "changes",
+    "SQLiteCatalog": "sqlite_backend",
+    "Snapshot": "snapshot",
+    "TitleIndex": "search",
+    "VectorEngine": "vectorized",
+    "compute_all": "analytics",
+}
+_SUBMODULES = (
+    "analytics",
+    "async_catalog",
+    "changes",
+    "graph",
+    "instrumentation",
+    "search",
+    "serialization",
+    "snapshot",
+    "sqlite_backend",
+    "vectorized",
+)
+
+__all__ = [
+    "Article",
+    "Author",
+    "BulkValidationError",
+    "Catalog",
+    "CatalogListener",
+    "Magazine",
+    "current_catalog",
+    *_LAZY,
+]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_SUBMODULES))
@@ -0,0 +1,123 @@
+"""Batch aggregations over every author and magazine at once.
+
+Articles are encoded as two parallel arrays of author and magazine IDs. The
+arrays are split into partitions, and each partition's (author, magazine)
+pair counts are computed in a separate process. Workers only ever receive
+raw bytes, never pickled model objects. The per-partition counts are then
+merged, and every aggregate is derived from the merged counts.
+
+Only the pair counting runs in the workers. Encoding has to read the model
+objects, and the aggregates are built from the merged counts, so both run
+serially in the calling process. At 1M articles they take about 0.3 s of the
+0.47 s a single process needs, which caps the speedup from adding workers at
+about 1.5x; lib/benchmarks/analytics.py reports the cap for other sizes.
+"""
+import os
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import attrgetter
+
+_author_of = attrgetter("_author")
+
+
+def encode(authors, magazines):
+    """Returns (author_ids, magazine_ids) arrays holding one entry per article,
+    grouped by magazine, where IDs are positions in the given authors and magazines"""
+    author_ids = {author: index for index, author in enumerate(authors)}
+    article_authors = array("I")
+    article_magazines = array("I")
+    # Magazine by magazine, since there are far fewer magazines than authors, and
+    # through map() so the per-article work stays in C
+    try:
+        for magazine_id, magazine in enumerate(magazines):
+            articles = magazine.articles()
+            article_authors.extend(map(author_ids.__getitem__, map(_author_of, articles)))
+            article_magazines.extend(repeat(magazine_id, len(articles)))
+    except KeyError as error:
+        raise ValueError(f"Author {error.args[0].name!r} was not passed in") from None
+    if len(article_authors) != sum(len(author.articles()) for author in authors):
+        passed = set(magazines)
+        for author in authors:
+            for article in author.articles():
+                if article.magazine not in passed:
+                    raise ValueError(f"Magazine {article.magazine.name!r} was not passed in")
+    return article_authors, article_magazines
+
+
+def _count_pairs(partition):
+    author_bytes, magazine_bytes = partition
+    author_ids = array("I")
+    author_ids.frombytes(author_bytes)
+    magazine_ids = array("I")
+    magazine_ids.frombytes(magazine_bytes)
+    return Counter(zip(author_ids, magazine_ids))
+
+
+def _partitions(author_ids, magazine_ids, count):
+    size = max(1, -(-len(author_ids) // count))
+    for start in range(0, len(author_ids), size):
+        yield (
+            author_ids[start : start + size].tobytes(),
+            magazine_ids[start : start + size].tobytes(),
+        )
+
+
+def count_pairs(author_ids, magazine_ids, workers=None):
+    """Returns a Counter of (author_id, magazine_id) -> number of articles.
+    With more than one worker the arrays are partitioned across a process pool"""
+    workers = workers or 1
+    if workers == 1 or len(author_ids) < workers:
+        return Counter(zip(author_ids, magazine_ids))
+
+    totals = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for counts in pool.map(_count_pairs, _partitions(author_ids, magazine_ids, workers * 4)):
+            totals.update(counts)
+    return totals
+
+
+class Analytics:
+    """Aggregates for a fixed set of authors and magazines, computed in one batch.
+
+    Lists are ordered by position in the authors/magazines passed in, and
+    follow the same None conventions as the Author and Magazine methods."""
+
+    def __init__(self, authors, magazines, pair_counts, min_articles=3):
+        self.article_counts = {magazine: 0 for magazine in magazines}
+        author_magazines = {author: [] for author in authors}
+        prolific = {magazine: [] for magazine in magazines}
+
+        for (author_id, magazine_id), count in sorted(pair_counts.items()):
+            author, magazine = authors[author_id], magazines[magazine_id]
+            self.article_counts[magazine] += count
+            author_magazines[author].append(magazine)
+            if count >= min_articles:
+                prolific[magazine].append(author)
+
+        self.magazines = author_magazines
+        self.topic_areas = {
+            author: list(dict.fromkeys(magazine.category for magazine in found)) or None
+            for author, found in author_magazines.items()
+        }
+        self.contributing_authors = {magazine: found or None for magazine, found in prolific.items()}
+
+        self.top_publisher = None
+        most = 0
+        for magazine, count in self.article_counts.items():
+            if count > most:
+                self.top_publisher, most = magazine, count
+
+
+def compute_all(authors, magazines, workers=None, min_articles=3):
+    """Computes magazines, topic areas, article counts, contributing authors and the
+    top publisher for every author and magazine. workers defaults to one process
+    per CPU; pass workers=1 to stay in this process. Only the pair counting is
+    parallel (see the module docstring)"""
+    authors = list(authors)
+    magazines = list(magazines)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    author_ids, magazine_ids = encode(authors, magazines)
+    return Analytics(authors, magazines, count_pairs(author_ids, magazine_ids, workers), min_articles)
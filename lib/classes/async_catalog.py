@@ -0,0 +1,103 @@
+"""An asyncio facade over the Author/Magazine/Article model.
+
+Writes made in the same event loop iteration are collected into one
+Article.from_records call, so the graph lock is taken once per batch rather
+than once per article. Aggregations that may have to rebuild a cached view run
+in an executor so they never stall the event loop.
+"""
+import asyncio
+import contextvars
+import functools
+
+from .many_to_many import Article, BulkValidationError, Magazine
+
+
+class AsyncCatalog:
+    """Async access to the model for asyncio request handlers"""
+
+    def __init__(self, executor=None, max_batch=1000):
+        self._executor = executor  # None means the loop's default thread pool
+        self._max_batch = max_batch
+        self._pending = []  # ((author, magazine, title), future) waiting to be committed
+        self._flush_handle = None
+
+    async def add_article(self, author, magazine, title):
+        """Creates an Article, committed together with other writes made concurrently"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(((author, magazine, title), future))
+        if len(self._pending) >= self._max_batch:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self.flush)
+        return await future
+
+    def flush(self):
+        """Commits every pending write now"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        try:
+            try:
+                articles = Article.from_records([record for record, _ in batch])
+            except BulkValidationError as error:
+                # Fail only the invalid writes and commit the rest
+                invalid = dict(error.errors)
+                for index, (_, future) in enumerate(batch):
+                    if index in invalid and not future.done():
+                        future.set_exception(ValueError(invalid[index]))
+                batch = [entry for index, entry in enumerate(batch) if index not in invalid]
+                articles = Article.from_records([record for record, _ in batch])
+        except Exception as error:
+            # Anything else, such as a listener raising, fails every write still
+            # waiting, so no caller is left awaiting a future nobody will resolve
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for article, (_, future) in zip(articles, batch):
+            if not future.done():
+                future.set_result(article)
+
+    async def _run(self, function, *args):
+        # Executor threads do not inherit context variables, so run in a copy of
+        # the caller's context to query the catalog that is current here
+        call = functools.partial(contextvars.copy_context().run, function, *args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    async def articles(self, owner, limit=None, after=None):
+        """Returns the author's or magazine's articles, or one page of them"""
+        return owner.articles(limit, after)
+
+    async def contributors(self, magazine):
+        """Returns Magazine.contributors()"""
+        return await self._run(magazine.contributors)
+
+    async def magazines(self, author):
+        """Returns Author.magazines()"""
+        return await self._run(author.magazines)
+
+    async def topic_areas(self, author):
+        """Returns Author.topic_areas()"""
+        return await self._run(author.topic_areas)
+
+    async def article_titles(self, magazine):
+        """Returns Magazine.article_titles()"""
+        return await self._run(magazine.article_titles)
+
+    async def contributing_authors(self, magazine, min_articles=3):
+        """Returns Magazine.contributing_authors(min_articles)"""
+        return await self._run(magazine.contributing_authors, min_articles)
+
+    async def top_publisher(self):
+        """Returns Magazine.top_publisher()"""
+        return await self._run(Magazine.top_publisher)
+
+    async def top_publishers(self, k):
+        """Returns Magazine.top_publishers(k)"""
+        return await self._run(Magazine.top_publishers, k)
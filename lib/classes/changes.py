@@ -0,0 +1,178 @@
+"""An append-only feed of changes to a catalog, for incremental consumers.
+
+ChangeFeed numbers every change in order:
+
+- an article added or removed (a move shows up as a removal and an addition)
+- a magazine renamed or recategorized
+
+Consumers read batches by sequence number instead of diffing
+author.articles() or Magazine.all_magazines. The buffer is bounded. It keeps
+only the changes that some registered consumer has not yet acknowledged, up
+to capacity. When the buffer is full, the oldest changes are either dropped,
+or the writer blocks until consumers catch up. If changes were dropped, a
+lagging consumer gets ChangesDropped. It must then resync from the catalog
+itself and call seek(error.first - 1) to continue from the oldest buffered
+change.
+"""
+import threading
+import time
+from collections import deque, namedtuple
+from itertools import islice
+
+from .many_to_many import CatalogListener, current_catalog
+
+# kind is "article_added", "article_removed", "magazine_renamed" or "magazine_recategorized".
+# subject is the article or magazine; previous is the old name or category, or None.
+Change = namedtuple("Change", ("sequence", "kind", "subject", "previous"))
+
+_MAGAZINE_KINDS = {"name": "magazine_renamed", "category": "magazine_recategorized"}
+_OVERFLOW = ("drop", "block")
+
+
+class ChangesDropped(Exception):
+    """Raised when a consumer asks for changes that have already left the buffer"""
+
+    def __init__(self, after, first):
+        self.first = first  # oldest sequence number still buffered
+        super().__init__(f"Changes after {after} were dropped; the oldest buffered change is {first}")
+
+
+class ChangeFeed(CatalogListener):
+    """A bounded, sequence-numbered buffer of a catalog's changes.
+
+    overflow="drop" discards the oldest changes when the buffer is full.
+    overflow="block" makes writers wait, for up to timeout seconds, until every
+    registered consumer has acknowledged enough changes to make room. It drops
+    the oldest changes after that. Writers hold the graph lock while they wait,
+    which stalls every other writer, so block mode needs a finite timeout and a
+    consumer must not write to the catalog in the same thread."""
+
+    def __init__(self, catalog=None, capacity=10_000, overflow="drop", timeout=None):
+        if overflow not in _OVERFLOW:
+            raise ValueError("overflow must be 'drop' or 'block'")
+        if overflow == "block" and (timeout is None or timeout < 0):
+            raise ValueError("overflow='block' needs a timeout of 0 seconds or more")
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("Capacity must be a positive integer")
+        self._capacity = capacity
+        self._overflow = overflow
+        self._timeout = timeout
+        self._changes = deque()
+        self._first = 1  # sequence number of self._changes[0]
+        self._consumers = []
+        self._condition = threading.Condition()
+        self._catalog = catalog or current_catalog()
+        self._catalog.subscribe(self)
+
+    def close(self):
+        """Stops recording changes"""
+        self._catalog.unsubscribe(self)
+
+    @property
+    def last_sequence(self):
+        """Returns the sequence number of the newest change, or 0 if there are none"""
+        return self._first + len(self._changes) - 1
+
+    def articles_added(self, articles):
+        for article in articles:
+            self._append("article_added", article, None)
+
+    def article_removed(self, article):
+        self._append("article_removed", article, None)
+
+    def magazine_changed(self, magazine, field, previous):
+        self._append(_MAGAZINE_KINDS[field], magazine, previous)
+
+    def _append(self, kind, subject, previous):
+        with self._condition:
+            if len(self._changes) >= self._capacity:
+                self._make_room()
+            self._changes.append(Change(self._first + len(self._changes), kind, subject, previous))
+            self._condition.notify_all()
+
+    def _make_room(self):
+        self._trim()
+        if len(self._changes) < self._capacity:
+            return
+        if self._overflow == "block" and self._consumers:
+            deadline = time.monotonic() + self._timeout
+            while len(self._changes) >= self._capacity:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+                self._trim()
+        while len(self._changes) >= self._capacity:
+            self._changes.popleft()
+            self._first += 1
+
+    def _trim(self):
+        # Drop changes every registered consumer has acknowledged
+        if not self._consumers:
+            return
+        acknowledged = min(consumer._position for consumer in self._consumers)
+        while self._changes and self._first <= acknowledged:
+            self._changes.popleft()
+            self._first += 1
+
+    def read(self, after=0, limit=1000, wait=None):
+        """Returns up to limit changes with sequence numbers above after, waiting up
+        to wait seconds for one to arrive if there are none yet. Raises
+        ChangesDropped if changes after that point are no longer buffered"""
+        with self._condition:
+            if wait and after >= self.last_sequence:
+                self._condition.wait_for(lambda: after < self.last_sequence, wait)
+            if after + 1 < self._first:
+                raise ChangesDropped(after, self._first)
+            start = after + 1 - self._first
+            return list(islice(self._changes, start, start + limit))
+
+    def consumer(self, after=None):
+        """Registers a consumer that reads from after (by default, from now on).
+        Changes it has not acknowledged are kept in the buffer"""
+        with self._condition:
+            consumer = Consumer(self, self.last_sequence if after is None else after)
+            self._consumers.append(consumer)
+            return consumer
+
+
+class Consumer:
+    """A registered reader of a ChangeFeed that acknowledges what it has processed"""
+
+    def __init__(self, feed, position):
+        self._feed = feed
+        self._position = position  # last acknowledged sequence number
+        self._polled = position  # last sequence number handed out
+
+    @property
+    def position(self):
+        return self._position
+
+    def poll(self, limit=1000, wait=None):
+        """Acknowledges the previous batch and returns the next one"""
+        self.commit()
+        batch = self._feed.read(self._position, limit, wait)
+        if batch:
+            self._polled = batch[-1].sequence
+        return batch
+
+    def commit(self):
+        """Acknowledges every change returned by poll so far, freeing buffer space"""
+        with self._feed._condition:
+            self._position = self._polled
+            self._feed._trim()
+            self._feed._condition.notify_all()
+
+    def seek(self, after):
+        """Moves the consumer so the next poll returns the changes after that sequence
+        number; after ChangesDropped, seek(error.first - 1) skips the dropped ones"""
+        with self._feed._condition:
+            self._position = self._polled = after
+            self._feed._trim()
+            self._feed._condition.notify_all()
+
+    def close(self):
+        """Unregisters the consumer so it no longer holds changes in the buffer"""
+        with self._feed._condition:
+            self._feed._consumers.remove(self)
+            self._feed._condition.notify_all()
@@ -0,0 +1,119 @@
+"""Neighbourhood queries over the author-magazine graph.
+
+AdjacencyIndex follows a catalog and keeps two maps up to date as articles
+are created, moved and deleted:
+
+- for each author, the magazines they write for, with article counts
+- for each magazine, the other magazines that share a contributor with it,
+  with the number of contributors they share
+
+Magazine overlap is updated when an author writes for a magazine for the
+first time. The cost is the number of magazines that author already writes
+for, which stays small even when a few magazines have very many contributors.
+Author-to-author adjacency is not stored, because on a power-law graph it
+grows with the square of the biggest magazine's contributor count. Instead
+it is counted on demand from each magazine's contributors.
+"""
+from collections import Counter
+from operator import itemgetter
+
+from .many_to_many import CatalogListener, current_catalog
+
+
+def _by_count(counts):
+    # Most first; the sort is stable, so ties keep their first-seen order
+    return sorted(counts.items(), key=itemgetter(1), reverse=True)
+
+
+class AdjacencyIndex(CatalogListener):
+    """Author-magazine adjacency and magazine overlap for a catalog"""
+
+    def __init__(self, catalog=None):
+        self._author_magazines = {}  # author -> {magazine: articles}
+        self._overlap = {}  # magazine -> {other magazine: shared contributors}
+        self._catalog = catalog or current_catalog()
+        self._catalog.subscribe(self, replay=True)
+
+    def close(self):
+        """Stops following the catalog"""
+        self._catalog.unsubscribe(self)
+
+    def articles_added(self, articles):
+        """Links new articles; called by the catalog"""
+        for article in articles:
+            magazines = self._author_magazines.setdefault(article.author, {})
+            count = magazines.get(article.magazine, 0)
+            if not count:
+                self._link(article.magazine, magazines, 1)
+            magazines[article.magazine] = count + 1
+
+    def article_removed(self, article):
+        """Unlinks a deleted or moved article; called by the catalog"""
+        magazines = self._author_magazines[article.author]
+        count = magazines[article.magazine] - 1
+        if count:
+            magazines[article.magazine] = count
+            return
+        del magazines[article.magazine]
+        if not magazines:
+            del self._author_magazines[article.author]
+        self._link(article.magazine, magazines, -1)
+
+    def _link(self, magazine, others, delta):
+        # The author has just started or stopped writing for magazine, which
+        # changes its overlap with every other magazine the author writes for
+        for other in others:
+            if other is not magazine:
+                self._count_overlap(magazine, other, delta)
+                self._count_overlap(other, magazine, delta)
+
+    def _count_overlap(self, magazine, other, delta):
+        overlap = self._overlap.setdefault(magazine, {})
+        shared = overlap.get(other, 0) + delta
+        if shared:
+            overlap[other] = shared
+        else:
+            del overlap[other]
+            if not overlap:
+                del self._overlap[magazine]
+
+    def magazines(self, author):
+        """Returns (magazine, articles) pairs for every magazine the author writes for"""
+        return tuple(self._author_magazines.get(author, {}).items())
+
+    def shared_magazines(self, author, other):
+        """Returns the magazines both authors have written for"""
+        theirs = self._author_magazines.get(other, {})
+        return tuple(magazine for magazine in tuple(self._author_magazines.get(author, ())) if magazine in theirs)
+
+    def co_authors(self, author):
+        """Returns (author, shared magazines) pairs for every author who shares a
+        magazine with this one, most shared magazines first"""
+        counts = Counter()
+        for magazine in tuple(self._author_magazines.get(author, ())):
+            counts.update(magazine.contributors())
+        counts.pop(author, None)
+        return _by_count(counts)
+
+    def overlapping_magazines(self, magazine):
+        """Returns (magazine, shared contributors) pairs for every magazine that shares
+        a contributor with this one, most shared contributors first"""
+        return _by_count(dict(self._overlap.get(magazine, {})))
+
+    def overlap(self, magazine, other):
+        """Returns the number of contributors two magazines share"""
+        return self._overlap.get(magazine, {}).get(other, 0)
+
+    def reachable_magazines(self, author):
+        """Returns the magazines the author, or anyone who shares a magazine with
+        them, writes for: the author's own magazines first"""
+        own = tuple(self._author_magazines.get(author, ()))
+        reached = dict.fromkeys(own)
+        for magazine in own:
+            reached.update(dict.fromkeys(tuple(self._overlap.get(magazine, ()))))
+        return tuple(reached)
+
+    def reachable_categories(self, author):
+        """Returns the categories of reachable_magazines(author), the author's own
+        topic areas first"""
+        return tuple(dict.fromkeys(magazine.category for magazine in self.reachable_magazines(author)))
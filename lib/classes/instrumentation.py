@@ -0,0 +1,198 @@
+"""Opt-in call statistics for Author, Magazine and Article.
+
+enable() replaces every public method, constructor and property setter of the
+three classes with a wrapper that records:
+
+- calls and exceptions
+- a latency histogram
+- the number of items returned
+
+It also counts constructions and validation failures (ValueError) per class.
+disable() puts the original functions back, so instrumentation costs nothing
+while it is off.
+
+snapshot() returns the statistics as plain data, and prometheus() renders them
+in the Prometheus text exposition format.
+"""
+import functools
+import threading
+import time
+from bisect import bisect_left
+
+from .many_to_many import Article, Author, BulkValidationError, Magazine
+
+CLASSES = (Author, Magazine, Article)
+# Histogram bucket upper bounds in seconds; the last bucket is +Inf
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+_lock = threading.Lock()
+_originals = {}  # (class, attribute name) -> original class attribute while enabled
+_methods = {}  # "Class.method" -> _MethodStats
+_constructions = {}  # class name -> instances created
+_validation_failures = {}  # class name -> values rejected
+
+
+class _MethodStats:
+    __slots__ = ("calls", "errors", "seconds", "buckets", "items")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.items = 0
+
+
+def _count(counts, key, amount=1):
+    counts[key] = counts.get(key, 0) + amount
+
+
+def _record(name, owner, validates, seconds, result, error):
+    with _lock:
+        stats = _methods.get(name)
+        if stats is None:
+            stats = _methods[name] = _MethodStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.buckets[bisect_left(BUCKETS, seconds)] += 1
+        if error is not None:
+            stats.errors += 1
+            # Only where values are checked, so a failure inside Author.add_article
+            # is counted once, by Article.__init__
+            if validates and isinstance(error, BulkValidationError):
+                _count(_validation_failures, owner, len(error.errors))
+            elif validates and isinstance(error, ValueError):
+                _count(_validation_failures, owner, 1)
+        elif name.endswith(".__init__"):
+            _count(_constructions, owner, 1)
+        elif hasattr(result, "__len__"):
+            stats.items += len(result)
+            if name == "Article.from_records":
+                _count(_constructions, owner, len(result))
+
+
+def _wrap(function, name, owner, validates=False):
+    @functools.wraps(function)
+    def instrumented(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except Exception as error:
+            _record(name, owner, validates, time.perf_counter() - start, None, error)
+            raise
+        _record(name, owner, validates, time.perf_counter() - start, result, None)
+        return result
+
+    return instrumented
+
+
+def _instrumented(cls, attribute, value):
+    # Returns the wrapped class attribute, or None if it is not instrumented
+    name = f"{cls.__name__}.{attribute}"
+    if isinstance(value, classmethod):
+        return classmethod(_wrap(value.__func__, name, cls.__name__, attribute == "from_records"))
+    if isinstance(value, property):
+        if value.fset is None:
+            return None
+        return value.setter(_wrap(value.fset, name + ".setter", cls.__name__, True))
+    if callable(value) and (attribute == "__init__" or not attribute.startswith("_")):
+        return _wrap(value, name, cls.__name__, attribute == "__init__")
+    return None
+
+
+def enable():
+    """Starts recording statistics; does nothing if already enabled"""
+    with _lock:
+        if _originals:
+            return
+        for cls in CLASSES:
+            for attribute, value in list(vars(cls).items()):
+                wrapped = _instrumented(cls, attribute, value)
+                if wrapped is not None:
+                    _originals[(cls, attribute)] = value
+                    setattr(cls, attribute, wrapped)
+
+
+def disable():
+    """Stops recording and restores the original methods; statistics are kept"""
+    with _lock:
+        for (cls, attribute), value in _originals.items():
+            setattr(cls, attribute, value)
+        _originals.clear()
+
+
+def enabled():
+    """Returns whether statistics are being recorded"""
+    return bool(_originals)
+
+
+def reset():
+    """Discards every statistic recorded so far"""
+    with _lock:
+        _methods.clear()
+        _constructions.clear()
+        _validation_failures.clear()
+
+
+def snapshot():
+    """Returns a copy of the statistics: {"methods": {"Class.method": {...}},
+    "constructions": {class: count}, "validation_failures": {class: count}}.
+    Histogram buckets are (upper bound in seconds, calls) pairs, not cumulative"""
+    with _lock:
+        return {
+            "methods": {
+                name: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "seconds": stats.seconds,
+                    "buckets": list(zip(BUCKETS + (float("inf"),), stats.buckets)),
+                    "items": stats.items,
+                }
+                for name, stats in _methods.items()
+            },
+            "constructions": dict(_constructions),
+            "validation_failures": dict(_validation_failures),
+        }
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+
+
+def prometheus(prefix="m2m"):
+    """Returns the statistics in the Prometheus text exposition format"""
+    stats = snapshot()
+    methods = sorted(stats["methods"].items())
+    lines = []
+
+    def family(name, kind, help_text):
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+    family("method_calls_total", "counter", "Calls of each instrumented method.")
+    for method, values in methods:
+        lines.append(f"{prefix}_method_calls_total{_labels(method=method)} {values['calls']}")
+    family("method_errors_total", "counter", "Calls that raised an exception.")
+    for method, values in methods:
+        lines.append(f"{prefix}_method_errors_total{_labels(method=method)} {values['errors']}")
+    family("method_result_items_total", "counter", "Items in the lists returned by each method.")
+    for method, values in methods:
+        lines.append(f"{prefix}_method_result_items_total{_labels(method=method)} {values['items']}")
+
+    family("method_duration_seconds", "histogram", "Latency of each instrumented method.")
+    for method, values in methods:
+        cumulative = 0
+        for bound, calls in values["buckets"]:
+            cumulative += calls
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f"{prefix}_method_duration_seconds_bucket{_labels(method=method, le=le)} {cumulative}")
+        lines.append(f"{prefix}_method_duration_seconds_sum{_labels(method=method)} {values['seconds']!r}")
+        lines.append(f"{prefix}_method_duration_seconds_count{_labels(method=method)} {values['calls']}")
+
+    family("constructions_total", "counter", "Instances created per class.")
+    for name, count in sorted(stats["constructions"].items()):
+        lines.append(f"{prefix}_constructions_total{_labels(**{'class': name})} {count}")
+    family("validation_failures_total", "counter", "Values rejected by validation per class.")
+    for name, count in sorted(stats["validation_failures"].items()):
+        lines.append(f"{prefix}_validation_failures_total{_labels(**{'class': name})} {count}")
+    return "\n".join(lines) + "\n"
@@ -1,60 +1,832 @@
-class Author:
+import contextvars
+import threading
+import time
+import weakref
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from itertools import islice
+
+# Serializes every write to the graph and its indexes. Readers never take it:
+# cached views are replaced rather than mutated, and the publisher ranking is
+# read optimistically and retried if a write overlapped (see MagazineRegistry).
+# Under the GIL, finer-grained lock striping would not let writes run in parallel.
+_lock = threading.RLock()
+# Source of article creation times; tests replace it to control the clock
+_clock = time.time
+
+
+class _ViewCache:
+    """Memoizes read-only derived views until the underlying articles change"""
+
+    __slots__ = ()
+
+    def _cached(self, key, build):
+        views = self._views
+        try:
+            return views[key]
+        except KeyError:
+            value = views[key] = build()
+            return value
+
+    def _invalidate(self):
+        # Swap in a fresh dict so a reader that built a view from older data
+        # stores it in the discarded dict rather than the live one
+        self._views = {}
+
+
+# Positions remembered per author or magazine for recently served page cursors,
+# keyed by id() so a hint never keeps a deleted article alive
+_CURSOR_HINTS = 64
+
+
+def _after(articles, after, hints):
+    if after is None:
+        return 0
+    position = hints.get(id(after)) if hints else None
+    # Articles are only ever appended in place, so a remembered position stays
+    # valid unless a removal replaced the list; check it before trusting it
+    if position is None or position >= len(articles) or articles[position] is not after:
+        try:
+            position = articles.index(after)
+        except ValueError:
+            raise ValueError("Cursor article is not in this list") from None
+    return position + 1
+
+
+def _page(owner, limit, after):
+    if limit is not None and (not isinstance(limit, int) or limit < 0):
+        raise ValueError("Limit must be a non-negative integer")
+    articles = owner._articles
+    start = _after(articles, after, owner._cursors)
+    page = articles[start:] if limit is None else articles[start : start + limit]
+    if page:
+        hints = owner._cursors
+        if hints is None or len(hints) >= _CURSOR_HINTS:
+            hints = owner._cursors = {}
+        hints[id(page[-1])] = start + len(page) - 1
+    return page
+
+
+def _stream(owner, after):
+    articles = owner._articles
+    start = _after(articles, after, owner._cursors)
+    # Stop at the length seen now, so articles appended while the caller is
+    # iterating are left for the next pass instead of extending this one
+    return islice(articles, start, len(articles))
+
+
+def _without(articles, article):
+    # Removals build a new list instead of shifting the old one in place, so
+    # pages and streams already reading the old list keep a stable order
+    index = articles.index(article)
+    return articles[:index] + articles[index + 1 :]
+
+
+def _index_add(index, key, item):
+    index.setdefault(key, {})[item] = None
+
+
+def _index_remove(index, key, item):
+    bucket = index[key]
+    del bucket[item]
+    if not bucket:
+        del index[key]
+
+
+class _Entry(weakref.KeyedRef):
+    """A weak reference to a registered instance, keyed by id(), along with the
+    values it is indexed under"""
+
+    __slots__ = ("name", "category", "count", "sequence")
+
+
+class _WeakRegistry:
+    """An insertion-ordered set of instances that does not keep them alive"""
+
+    def __init__(self):
+        self._entries = {}  # id(instance) -> _Entry
+        # Weak reference callbacks can run in the middle of a write, so they only
+        # queue the dead entry; it is removed from the indexes on the next purge
+        self._collected = deque()
+
+    def _entry(self, item):
+        entry = self._entries.get(id(item))
+        return entry if entry is not None and entry() is item else None
+
+    def __iter__(self):
+        self._purge()
+        return iter([item for item in (entry() for entry in list(self._entries.values())) if item is not None])
+
+    def __len__(self):
+        self._purge()
+        return len(self._entries)
+
+    def __contains__(self, item):
+        return self._entry(item) is not None
+
+    def _live(self, keys):
+        entries = self._entries
+        return tuple(
+            item for item in (entries[key]() for key in tuple(keys) if key in entries) if item is not None
+        )
+
+    def append(self, item):
+        """Registers an instance"""
+        with _lock:
+            self._purge()
+            if self._entry(item) is None:
+                entry = _Entry(item, self._collected.append, id(item))
+                self._entries[entry.key] = entry
+                self._added(item, entry)
+
+    def discard(self, item):
+        """Forgets an instance if it is registered"""
+        with _lock:
+            entry = self._entry(item)
+            if entry is not None:
+                del self._entries[entry.key]
+                self._removed(entry)
+
+    def clear(self):
+        """Forgets every registered instance"""
+        with _lock:
+            self._entries.clear()
+            self._collected.clear()
+            self._cleared()
+
+    def _purge(self):
+        if not self._collected:
+            return
+        with _lock:
+            while self._collected:
+                entry = self._collected.popleft()
+                # The id may already belong to a newer instance
+                if self._entries.get(entry.key) is entry:
+                    del self._entries[entry.key]
+                    self._removed(entry)
+
+    def _added(self, item, entry):
+        pass
+
+    def _removed(self, entry):
+        pass
+
+    def _cleared(self):
+        pass
+
+
+class AuthorRegistry(_WeakRegistry):
+    """Keeps track of every live Author, indexed by name"""
+
+    def __init__(self):
+        super().__init__()
+        self._by_name = {}
+
+    def _added(self, author, entry):
+        entry.name = author._name
+        _index_add(self._by_name, entry.name, entry.key)
+
+    def _removed(self, entry):
+        _index_remove(self._by_name, entry.name, entry.key)
+
+    def _cleared(self):
+        self._by_name.clear()
+
+    def by_name(self, name):
+        """Returns every registered author with this name"""
+        self._purge()
+        return self._live(self._by_name.get(name, ()))
+
+
+class MagazineRegistry(_WeakRegistry):
+    """Keeps track of every live Magazine, indexed by name and category, along
+    with a running ranking by article count"""
+
+    def __init__(self):
+        super().__init__()
+        # article count -> (registration sequence, id) of magazines with that count, sorted
+        self._buckets = {}
+        self._registered = 0  # registration sequence of the next magazine
+        self._max_count = 0
+        self._by_name = {}
+        self._by_category = {}
+        self._version = 0  # odd while a writer is changing the ranking
+
+    def _added(self, magazine, entry):
+        entry.name = magazine._name
+        entry.category = magazine._category
+        entry.count = 0
+        entry.sequence = self._registered
+        self._registered += 1
+        _index_add(self._by_name, entry.name, entry.key)
+        _index_add(self._by_category, entry.category, entry.key)
+        if magazine._articles:
+            self._article_added(magazine, len(magazine._articles))
+
+    def _removed(self, entry):
+        _index_remove(self._by_name, entry.name, entry.key)
+        _index_remove(self._by_category, entry.category, entry.key)
+        if entry.count:
+            self._version += 1
+            self._leave_bucket(entry)
+            if self._max_count not in self._buckets:
+                self._max_count = max(self._buckets, default=0)
+            self._version += 1
+
+    def _cleared(self):
+        self._version += 1
+        self._buckets.clear()
+        self._max_count = 0
+        self._version += 1
+        self._by_name.clear()
+        self._by_category.clear()
+
+    def _renamed(self, magazine):
+        entry = self._entry(magazine)
+        if entry is not None:
+            _index_remove(self._by_name, entry.name, entry.key)
+            entry.name = magazine._name
+            _index_add(self._by_name, entry.name, entry.key)
+
+    def _recategorized(self, magazine):
+        entry = self._entry(magazine)
+        if entry is not None:
+            _index_remove(self._by_category, entry.category, entry.key)
+            entry.category = magazine._category
+            _index_add(self._by_category, entry.category, entry.key)
+
+    def by_name(self, name):
+        """Returns every registered magazine with this name"""
+        self._purge()
+        return self._live(self._by_name.get(name, ()))
+
+    def by_category(self, category):
+        """Returns every registered magazine in this category"""
+        self._purge()
+        return self._live(self._by_category.get(category, ()))
+
+    def _article_added(self, magazine, added=1):
+        entry = self._entry(magazine)
+        if entry is None:
+            return
+        self._version += 1
+        if entry.count:
+            self._leave_bucket(entry)
+        entry.count += added
+        self._join_bucket(entry)
+        if entry.count > self._max_count:
+            self._max_count = entry.count
+        self._version += 1
+
+    def _article_removed(self, magazine):
+        entry = self._entry(magazine)
+        if entry is None or not entry.count:
+            return
+        self._version += 1
+        self._leave_bucket(entry)
+        entry.count -= 1
+        if entry.count:
+            self._join_bucket(entry)
+        if self._max_count not in self._buckets:
+            self._max_count = entry.count
+        self._version += 1
+
+    def _join_bucket(self, entry):
+        # Buckets stay in registration order, so ties go to the magazine registered first
+        insort(self._buckets.setdefault(entry.count, []), (entry.sequence, entry.key))
+
+    def _leave_bucket(self, entry):
+        bucket = self._buckets[entry.count]
+        del bucket[bisect_left(bucket, (entry.sequence, entry.key))]
+        if not bucket:
+            del self._buckets[entry.count]
+
+    def _read_ranking(self, read):
+        # Retry instead of blocking when a writer changed the ranking mid-read
+        while True:
+            version = self._version
+            if not version & 1:
+                try:
+                    result = read()
+                except (KeyError, RuntimeError):
+                    result = None
+                if self._version == version:
+                    return result
+            time.sleep(0)  # let the writer finish
+
+    def ranked(self, k=None):
+        """Returns up to k magazines with articles, most articles first"""
+        if k is not None and k <= 0:
+            return []
+        return self._read_ranking(lambda: self._ranked(k))
+
+    def _ranked(self, k):
+        result = []
+        for count in sorted(self._buckets, reverse=True):
+            for magazine in self._live([key for _, key in self._buckets[count]]):
+                result.append(magazine)
+                if k is not None and len(result) == k:
+                    return result
+        return result
+
+    def top(self):
+        """Returns the magazine with the most articles, or None if there are no articles.
+        Ties go to the magazine registered first."""
+        return self._read_ranking(self._top)
+
+    def top_in_category(self, category):
+        """Returns the magazine in this category with the most articles, or None"""
+        self._purge()
+        entries = (self._entries.get(key) for key in tuple(self._by_category.get(category, ())))
+        return self._best((entry(), entry.count) for entry in entries if entry is not None)
+
+    def _best(self, counts):
+        # The magazine with the highest of the (magazine, count) pairs, or None if no
+        # count is positive; ties go to the magazine registered first
+        best, rank = None, (0, 0)
+        for magazine, count in counts:
+            if magazine is None or not count:
+                continue
+            entry = self._entry(magazine)
+            sequence = entry.sequence if entry is not None else self._registered
+            if (count, -sequence) > rank:
+                best, rank = magazine, (count, -sequence)
+        return best
+
+    def _top(self):
+        if not self._max_count:
+            return None
+        for _, key in self._buckets[self._max_count]:
+            magazine = self._entries[key]()
+            if magazine is not None:
+                return magazine
+        return None
+
+
+# Newly registered articles are sorted into a separate run, and merged into the
+# main index once that run outgrows 1/2**_RECENT_SHIFT of the index (or _RECENT_RUN)
+_RECENT_RUN = 256
+_RECENT_SHIFT = 7
+
+
+class ArticleRegistry:
+    """Keeps track of every Article in a title-sorted index for prefix lookups.
+
+    Articles are data rather than handles, so they stay registered (and alive)
+    until Article.delete() is called or their catalog is dropped. A catalog
+    only builds this registry the first time it is used, so a catalog that
+    never looks articles up by title does not keep them alive. There is no
+    per-article membership dict; membership is answered from the title index.
+
+    New articles go into a small sorted run that lookups search alongside the
+    main index, so a lookup after an insert does not re-sort the whole index.
+    A deleted article is tombstoned rather than cut out of the index, and the
+    index is compacted once tombstones make up a quarter of it, so a delete
+    does not copy the whole index either."""
+
+    def __init__(self):
+        self._by_title = []  # articles sorted by title
+        self._titles = []  # their titles, for bisecting
+        self._recent = []  # articles added since the last merge, sorted by title
+        self._recent_titles = []
+        self._unsorted = []  # articles registered since the index was last sorted
+        self._removed = set()  # deleted articles still indexed until the next compaction
+
+    def __iter__(self):
+        self._compact()
+        return iter(self._by_title)
+
+    def __len__(self):
+        return len(self._by_title) + len(self._recent) + len(self._unsorted) - len(self._removed)
+
+    def __contains__(self, article):
+        title = getattr(article, "_title", None)
+        if not isinstance(title, str):
+            return False
+        self._sort()
+        found = _indexed(self._by_title, self._titles, article, title) or _indexed(
+            self._recent, self._recent_titles, article, title
+        )
+        return found and article not in self._removed
+
+    def append(self, article):
+        """Registers an article"""
+        with _lock:
+            self._unsorted.append(article)
+
+    def extend(self, articles):
+        """Registers several articles"""
+        with _lock:
+            self._unsorted.extend(articles)
+
+    def discard(self, article):
+        """Forgets an article if it is registered"""
+        with _lock:
+            if article in self:
+                self._removed.add(article)
+                if len(self._removed) * 4 > len(self._by_title) + len(self._recent):
+                    self._compact()
+
+    def clear(self):
+        """Forgets every registered article"""
+        with _lock:
+            self._by_title = []
+            self._titles = []
+            self._recent = []
+            self._recent_titles = []
+            self._unsorted = []
+            self._removed = set()
+
+    def _sort(self):
+        if self._unsorted:
+            with _lock:
+                unsorted = self._unsorted
+                if len(unsorted) < _RECENT_RUN:
+                    # Insert into copies so readers never see a half-updated run
+                    recent, titles = self._recent[:], self._recent_titles[:]
+                    for article in unsorted:
+                        index = bisect_right(titles, article._title)
+                        recent.insert(index, article)
+                        titles.insert(index, article._title)
+                else:
+                    # Timsort merges the already-sorted run with the new tail cheaply
+                    recent = self._recent + unsorted
+                    recent.sort(key=_title_of)
+                    titles = [article._title for article in recent]
+                if len(recent) > max(_RECENT_RUN, len(self._by_title) >> _RECENT_SHIFT):
+                    by_title = self._by_title + recent
+                    by_title.sort(key=_title_of)
+                    self._by_title, self._titles = by_title, [article._title for article in by_title]
+                    recent, titles = [], []
+                self._recent, self._recent_titles = recent, titles
+                self._unsorted = []
+
+    def _compact(self):
+        self._sort()
+        if self._recent or self._removed:
+            with _lock:
+                removed = self._removed
+                by_title = self._by_title + self._recent
+                by_title.sort(key=_title_of)
+                if removed:
+                    by_title = [article for article in by_title if article not in removed]
+                self._by_title, self._titles = by_title, [article._title for article in by_title]
+                self._recent, self._recent_titles = [], []
+                self._removed = set()
+
+    def by_title_prefix(self, prefix):
+        """Returns every registered article whose title starts with prefix, sorted by title"""
+        self._sort()
+        found = _prefixed(self._by_title, self._titles, prefix)
+        recent = _prefixed(self._recent, self._recent_titles, prefix)
+        if recent:
+            # Stable, so equal titles stay in registration order
+            found = sorted(found + recent, key=_title_of)
+        removed = self._removed
+        if removed:
+            return tuple(article for article in found if article not in removed)
+        return tuple(found)
+
+
+def _indexed(articles, titles, article, title):
+    index = bisect_left(titles, title)
+    while index < len(titles) and titles[index] == title:
+        if articles[index] is article:
+            return True
+        index += 1
+    return False
+
+
+def _prefixed(articles, titles, prefix):
+    start = end = bisect_left(titles, prefix)
+    while end < len(titles) and titles[end].startswith(prefix):
+        end += 1
+    return articles[start:end]
+
+
+def _title_of(article):
+    return article._title
+
+
+class CatalogListener:
+    """Base class for objects passed to Catalog.subscribe. Each method is called
+    under the graph lock while the change is being made; override the ones needed"""
+
+    def articles_added(self, articles):
+        """Called with new articles, in creation order"""
+
+    def article_removed(self, article):
+        """Called before a deleted or moved article is unlinked"""
+
+    def magazine_changed(self, magazine, field, previous):
+        """Called after a magazine's "name" or "category" field changed from previous"""
+
+
+# Windows that keep a running total; every write updates each of them
+_TRACKED_WINDOWS = 8
+
+
+class TrendingCounter(CatalogListener):
+    """Counts a catalog's articles per magazine in fixed time buckets covering the
+    last retention seconds, so recent rankings never rescan older articles.
+
+    The most recently queried windows, up to _TRACKED_WINDOWS, also keep a
+    running total per magazine, which moves forward by subtracting the buckets
+    that fall out of it. Other windows are summed from the buckets again."""
+
+    def __init__(self, catalog, resolution=60, retention=86400):
+        self._resolution = resolution
+        self._span = -(-retention // resolution)  # buckets retained
+        self._numbers = []  # retained bucket numbers, ascending
+        self._buckets = {}  # bucket number -> {magazine: articles created in it}
+        # window in buckets -> [first bucket number counted, {magazine: articles}],
+        # least recently queried first
+        self._windows = {}
+        self._current = int(_clock() // resolution)
+        self._magazines = catalog.magazines
+        catalog.subscribe(self, replay=True)
+
+    def _number(self, article):
+        return int(article._created // self._resolution)
+
+    def articles_added(self, articles):
+        """Counts new articles; called by the catalog"""
+        for article in articles:
+            number = self._number(article)
+            counts = self._buckets.get(number)
+            if counts is None:
+                # The first article in a new bucket also expires the oldest ones,
+                # so retention holds even if no windowed query ever runs
+                self._advance()
+                if number <= self._current - self._span:
+                    continue  # older than anything retained (only while replaying)
+                counts = self._buckets[number] = {}
+                insort(self._numbers, number)
+            magazine = article._magazine
+            counts[magazine] = counts.get(magazine, 0) + 1
+            for first, totals in self._windows.values():
+                if number >= first:
+                    totals[magazine] = totals.get(magazine, 0) + 1
+
+    def article_removed(self, article):
+        """Uncounts a deleted or moved article; called by the catalog"""
+        number = self._number(article)
+        counts = self._buckets.get(number)
+        if counts is None:
+            return
+        magazine = article._magazine
+        _decrement(counts, magazine, 1)
+        for first, totals in self._windows.values():
+            if number >= first:
+                _decrement(totals, magazine, 1)
+
+    def _advance(self):
+        current = max(self._current, int(_clock() // self._resolution))
+        if current == self._current:
+            return
+        self._current = current
+        for span, window in self._windows.items():
+            first = current - span + 1
+            for number in self._numbers:
+                if number >= first:
+                    break
+                if number >= window[0]:
+                    for magazine, count in self._buckets[number].items():
+                        _decrement(window[1], magazine, count)
+            window[0] = first
+        while self._numbers and self._numbers[0] <= current - self._span:
+            del self._buckets[self._numbers.pop(0)]
+
+    def _totals(self, window):
+        span = -(-window // self._resolution)
+        if window <= 0 or span > self._span:
+            raise ValueError(f"Window must be between 1 and {self._span * self._resolution} seconds")
+        with _lock:
+            self._advance()
+            entry = self._windows.pop(span, None)
+            if entry is None:
+                first = self._current - span + 1
+                totals = {}
+                for number in self._numbers:
+                    if number >= first:
+                        for magazine, count in self._buckets[number].items():
+                            totals[magazine] = totals.get(magazine, 0) + count
+                entry = [first, totals]
+                if len(self._windows) >= _TRACKED_WINDOWS:
+                    del self._windows[next(iter(self._windows))]
+            self._windows[span] = entry
+            return dict(entry[1])
+
+    def top(self, window, category=None):
+        """Returns the magazine with the most articles created in the last window
+        seconds, optionally only among magazines in category, or None. The window
+        is rounded up to whole buckets"""
+        totals = self._totals(window)
+        if category is not None:
+            totals = {magazine: totals[magazine] for magazine in self._magazines.by_category(category) if magazine in totals}
+        return self._magazines._best(totals.items())
+
+
+def _decrement(counts, key, amount):
+    count = counts[key] - amount
+    if count:
+        counts[key] = count
+    else:
+        del counts[key]
+
+
+class Catalog:
+    """A separate set of author, magazine and article registries.
+
+    New instances join the current catalog, which is the process-wide default
+    unless a `with Catalog():` block is active in this thread or task. Use
+    one catalog per tenant or test case to keep their state apart."""
+
+    def __init__(self):
+        self.authors = AuthorRegistry()
+        self.magazines = MagazineRegistry()
+        self._articles = None
+        self._listeners = ()
+        self._trending = None
+
+    def __enter__(self):
+        # The token goes on a stack owned by this thread or task, so the same
+        # catalog can be entered from several of them at once
+        token = _current_catalog.set(self)
+        _catalog_tokens.set(_catalog_tokens.get() + (token,))
+        return self
+
+    def __exit__(self, *exc_info):
+        tokens = _catalog_tokens.get()
+        _catalog_tokens.set(tokens[:-1])
+        _current_catalog.reset(tokens[-1])
+
+    @property
+    def articles(self):
+        """Returns the catalog's ArticleRegistry, building it from the registered
+        magazines on first use. From then on the catalog keeps every article alive
+        until it is deleted"""
+        if self._articles is None:
+            with _lock:
+                if self._articles is None:
+                    registry = ArticleRegistry()
+                    for magazine in self.magazines:
+                        registry.extend(magazine._articles)
+                    self._articles = registry
+        return self._articles
+
+    @property
+    def trending(self):
+        """Returns the catalog's TrendingCounter, creating it on first use"""
+        if self._trending is None:
+            with _lock:
+                if self._trending is None:
+                    self._trending = TrendingCounter(self)
+        return self._trending
+
+    def subscribe(self, listener, replay=False):
+        """Notifies a CatalogListener of every change to this catalog's articles and
+        magazines. Moving an article to another author or magazine is reported as a
+        removal followed by an addition. With replay, the articles already registered
+        are passed to articles_added first, magazine by magazine in publication order"""
+        with _lock:
+            if replay:
+                for magazine in self.magazines:
+                    if magazine._articles:
+                        listener.articles_added(tuple(magazine._articles))
+            self._listeners = self._listeners + (listener,)
+
+    def unsubscribe(self, listener):
+        """Stops notifying a subscribed listener"""
+        with _lock:
+            self._listeners = tuple(other for other in self._listeners if other is not listener)
+
+
+_current_catalog = contextvars.ContextVar("catalog", default=Catalog())
+_catalog_tokens = contextvars.ContextVar("catalog_tokens", default=())
+
+
+def current_catalog():
+    """Returns the catalog new instances are registered in"""
+    return _current_catalog.get()
+
+
+class _CatalogRegistry:
+    """Class attribute that resolves to the current catalog's registry"""
+
     def __init__(self, name):
-        if not isinstance(name, str):
-            raise ValueError("Name must be a string")
-        if len(name) <= 0:
-            raise ValueError("Name must be longer than 0 characters")
+        self._name = name
+
+    def __get__(self, instance, owner):
+        return getattr(_current_catalog.get(), self._name)
+
+
+class Author(_ViewCache):
+    __slots__ = ("_name", "_articles", "_views", "_cursors", "__weakref__")
+
+    all_authors = _CatalogRegistry("authors")
+
+    def __init__(self, name):
+        self._check_name(name)
         self._name = name
         self._articles = []  # Internal cache
+        self._views = {}
+        self._cursors = None
+        Author.all_authors.append(self)
+
+    @staticmethod
+    def _check_name(value):
+        if not isinstance(value, str):
+            raise ValueError("Name must be a string")
+        if len(value) <= 0:
+            raise ValueError("Name must be longer than 0 characters")
 
     @property
     def name(self):
         return self._name
 
-    def articles(self):
-        """Returns a list of all articles the author has written"""
-        return self._articles
+    def articles(self, limit=None, after=None):
+        """Returns a list of all articles the author has written. With limit or after,
+        returns up to limit articles following the article passed as after"""
+        if limit is None and after is None:
+            return self._articles
+        return _page(self, limit, after)
+
+    def iter_articles(self, after=None):
+        """Yields the author's articles, optionally resuming after an article"""
+        return _stream(self, after)
 
     def magazines(self):
-        """Returns a unique list of magazines for which the author has contributed to"""
-        unique_magazines = set()
-        for article in self._articles:
-            unique_magazines.add(article.magazine)
-        return list(unique_magazines)
+        """Returns a unique, read-only list of magazines for which the author has contributed to"""
+        return self._cached("magazines", self._build_magazines)
+
+    def _build_magazines(self):
+        return tuple({article.magazine: None for article in tuple(self._articles)})
+
+    def _add_article(self, article):
+        self._articles.append(article)
+        self._invalidate()
+
+    def _add_articles(self, articles):
+        self._articles.extend(articles)
+        self._invalidate()
+
+    def _remove_article(self, article):
+        self._articles = _without(self._articles, article)
+        self._invalidate()
 
     def add_article(self, magazine, title):
         """Creates a new Article instance and associates it with that author and magazine"""
         new_article = Article(self, magazine, title)
         return new_article
 
+    @classmethod
+    def find_by_name(cls, name):
+        """Returns the first registered author with this name, or None"""
+        matches = cls.all_authors.by_name(name)
+        return matches[0] if matches else None
+
     def topic_areas(self):
-        """Returns a unique list of categories of the magazines the author has contributed to"""
+        """Returns a unique, read-only list of categories of the magazines the author has contributed to"""
         if not self._articles:
             return None
+        return self._cached("topic_areas", self._build_topic_areas)
 
-        categories = set()
-        for article in self._articles:
-            categories.add(article.magazine.category)
-        return list(categories)
+    def _build_topic_areas(self):
+        return tuple({magazine.category: None for magazine in self.magazines()})
 
 
-class Magazine:
-    all_magazines = []
+class Magazine(_ViewCache):
+    __slots__ = ("_name", "_category", "_articles", "_author_counts", "_views", "_cursors", "_catalog", "__weakref__")
+
+    all_magazines = _CatalogRegistry("magazines")
 
     def __init__(self, name, category):
-        if not isinstance(name, str):
-            raise ValueError("Name must be a string")
-        if len(name) < 2 or len(name) > 16:
-            raise ValueError("Name must be between 2 and 16 characters")
-        if not isinstance(category, str):
-            raise ValueError("Category must be a string")
-        if len(category) <= 0:
-            raise ValueError("Category must be longer than 0 characters")
+        self._check_name(name)
+        self._check_category(category)
 
         self._name = name
         self._category = category
         self._articles = []
-        Magazine.all_magazines.append(self)
+        self._author_counts = {}  # author -> number of articles in this magazine
+        self._views = {}
+        self._cursors = None
+        self._catalog = current_catalog()
+        self._catalog.magazines.append(self)
+
+    @staticmethod
+    def _check_name(value):
+        if not isinstance(value, str):
+            raise ValueError("Name must be a string")
+        if len(value) < 2 or len(value) > 16:
+            raise ValueError("Name must be between 2 and 16 characters")
+
+    @staticmethod
+    def _check_category(value):
+        if not isinstance(value, str):
+            raise ValueError("Category must be a string")
+        if len(value) <= 0:
+            raise ValueError("Category must be longer than 0 characters")
 
     @property
     def name(self):
@@ -62,11 +834,12 @@ class Magazine:
 
     @name.setter
     def name(self, value):
-        if not isinstance(value, str):
-            raise ValueError("Name must be a string")
-        if len(value) < 2 or len(value) > 16:
-            raise ValueError("Name must be between 2 and 16 characters")
-        self._name = value
+        self._check_name(value)
+        with _lock:
+            previous, self._name = self._name, value
+            self._catalog.magazines._renamed(self)
+            for listener in self._catalog._listeners:
+                listener.magazine_changed(self, "name", previous)
 
     @property
     def category(self):
@@ -74,77 +847,241 @@ class Magazine:
 
     @category.setter
     def category(self, value):
-        if not isinstance(value, str):
-            raise ValueError("Category must be a string")
-        if len(value) <= 0:
-            raise ValueError("Category must be longer than 0 characters")
-        self._category = value
+        self._check_category(value)
+        with _lock:
+            previous, self._category = self._category, value
+            self._catalog.magazines._recategorized(self)
+            # Contributors' topic areas are derived from this category
+            for author in self.contributors():
+                author._invalidate()
+            for listener in self._catalog._listeners:
+                listener.magazine_changed(self, "category", previous)
 
-    def articles(self):
-        """Returns a list of all the articles the magazine has published"""
-        return self._articles
+    def _add_article(self, article):
+        self._articles.append(article)
+        counts = self._author_counts
+        counts[article._author] = counts.get(article._author, 0) + 1
+        self._catalog.magazines._article_added(self)
+        self._invalidate()
+
+    def _add_articles(self, articles):
+        self._articles.extend(articles)
+        counts = self._author_counts
+        for article in articles:
+            counts[article._author] = counts.get(article._author, 0) + 1
+        self._catalog.magazines._article_added(self, len(articles))
+        self._invalidate()
+
+    def _remove_article(self, article):
+        self._articles = _without(self._articles, article)
+        self._count_author(article.author, -1)
+        self._catalog.magazines._article_removed(self)
+        self._invalidate()
+
+    def _count_author(self, author, delta):
+        count = self._author_counts.get(author, 0) + delta
+        if count:
+            self._author_counts[author] = count
+        else:
+            del self._author_counts[author]
+
+    def articles(self, limit=None, after=None):
+        """Returns a list of all the articles the magazine has published. With limit or
+        after, returns up to limit articles following the article passed as after"""
+        if limit is None and after is None:
+            return self._articles
+        return _page(self, limit, after)
+
+    def iter_articles(self, after=None):
+        """Yields the magazine's articles, optionally resuming after an article"""
+        return _stream(self, after)
 
     def contributors(self):
-        """Returns a unique list of authors who have written for this magazine"""
-        authors = set()
-        for article in self._articles:
-            authors.add(article.author)
-        return list(authors)
+        """Returns a unique, read-only list of authors who have written for this magazine"""
+        return self._cached("contributors", lambda: tuple(self._author_counts))
 
-    def article_titles(self):
-        """Returns a list of titles of all articles written for that magazine"""
-        if not self._articles:
-            return None
-        return [article.title for article in self._articles]
+    def contributor_count(self, author):
+        """Returns the number of articles the author has written for this magazine"""
+        return self._author_counts.get(author, 0)
 
-    def contributing_authors(self):
-        """Returns a list of authors who have written more than 2 articles for the magazine"""
+    def article_titles(self):
+        """Returns a read-only list of titles of all articles written for that magazine"""
         if not self._articles:
             return None
+        return self._cached("article_titles", self._build_article_titles)
 
-        author_count = {}
-        for article in self._articles:
-            author = article.author
-            author_count[author] = author_count.get(author, 0) + 1
+    def _build_article_titles(self):
+        return tuple(article.title for article in tuple(self._articles))
 
-        result = []
-        for author, count in author_count.items():
-            if count > 2:
-                result.append(author)
+    def iter_article_titles(self, after=None):
+        """Yields the titles of the magazine's articles without building a list,
+        optionally resuming after an article"""
+        return map(_title_of, _stream(self, after))
 
+    def contributing_authors(self, min_articles=3):
+        """Returns a read-only list of authors who have written at least min_articles
+        (by default more than 2) articles for the magazine"""
+        result = self._cached(
+            ("contributing_authors", min_articles),
+            lambda: tuple(
+                author
+                for author, count in tuple(self._author_counts.items())
+                if count >= min_articles
+            ),
+        )
         return result if result else None
 
     @classmethod
-    def top_publisher(cls):
-        """Returns the Magazine instance with the most articles"""
-        if not cls.all_magazines:
-            return None
+    def find_by_name(cls, name):
+        """Returns the first registered magazine with this name, or None"""
+        matches = cls.all_magazines.by_name(name)
+        return matches[0] if matches else None
+
+    @classmethod
+    def find_by_category(cls, category):
+        """Returns a read-only list of registered magazines in this category"""
+        return cls.all_magazines.by_category(category)
+
+    @classmethod
+    def top_publisher(cls, window=None, category=None):
+        """Returns the Magazine instance with the most articles. With window, only
+        articles created in the last window seconds count; with category, only
+        magazines in that category are ranked"""
+        if window is not None:
+            return current_catalog().trending.top(window, category)
+        if category is not None:
+            return cls.all_magazines.top_in_category(category)
+        return cls.all_magazines.top()
+
+    @classmethod
+    def top_publishers(cls, k):
+        """Returns up to k Magazine instances with the most articles, in descending order"""
+        return cls.all_magazines.ranked(k)
 
-        top_magazine = None
-        max_articles = 0
 
-        for magazine in cls.all_magazines:
-            article_count = len(magazine.articles())
-            if article_count > max_articles:
-                max_articles = article_count
-                top_magazine = magazine
+class BulkValidationError(ValueError):
+    """Raised when some records passed to Article.from_records are invalid"""
 
-        return top_magazine
+    def __init__(self, errors):
+        self.errors = errors  # (row index, message) for every invalid record
+        index, message = errors[0]
+        super().__init__(f"{len(errors)} invalid record(s), first at row {index}: {message}")
 
 
 class Article:
-    def __init__(self, author, magazine, title):
-        self._author = None
-        self._magazine = None
-        self._title = None
+    # Articles vastly outnumber authors and magazines, so skip the per-instance __dict__
+    __slots__ = ("_author", "_magazine", "_title", "_created")
 
-        self.author = author
-        self.magazine = magazine
-        self.title = title
+    all_articles = _CatalogRegistry("articles")
+
+    def __init__(self, author, magazine, title):
+        # The same checks as the property setters, inlined because construction is
+        # the hot path; the _check_* helpers only run to report an invalid value
+        if not isinstance(author, Author):
+            self._check_author(author)
+        if not isinstance(magazine, Magazine):
+            self._check_magazine(magazine)
+        if type(title) is not str or not 5 <= len(title) <= 50:
+            self._check_title(title)
+        self._author = author
+        self._magazine = magazine
+        self._title = title
+        self._created = _clock()
 
         # Add this article to author's and magazine's lists
-        author._articles.append(self)
-        magazine._articles.append(self)
+        with _lock:
+            author._add_article(self)
+            magazine._add_article(self)
+            catalog = magazine._catalog
+            if catalog._articles is not None:
+                catalog._articles.append(self)
+            for listener in catalog._listeners:
+                listener.articles_added((self,))
+
+    @classmethod
+    def from_records(cls, records):
+        """Creates an Article for every (author, magazine, title) record in one batch.
+        All records are validated first; if any are invalid, none are created and a
+        BulkValidationError listing every invalid row is raised"""
+        rows = records if isinstance(records, list) else list(records)
+
+        errors = []
+        for index, row in enumerate(rows):
+            try:
+                author, magazine, title = row
+                cls._check_author(author)
+                cls._check_magazine(magazine)
+                cls._check_title(title)
+            except (TypeError, ValueError) as error:
+                errors.append((index, str(error)))
+        if errors:
+            raise BulkValidationError(errors)
+
+        articles = []
+        by_author = {}
+        by_magazine = {}
+        created = _clock()  # one shared timestamp per batch
+        for author, magazine, title in rows:
+            article = cls.__new__(cls)
+            article._author = author
+            article._magazine = magazine
+            article._title = title
+            article._created = created
+            articles.append(article)
+            by_author.setdefault(author, []).append(article)
+            by_magazine.setdefault(magazine, []).append(article)
+
+        # One extend per author and magazine instead of one append per article
+        with _lock:
+            for author, group in by_author.items():
+                author._add_articles(group)
+            for magazine, group in by_magazine.items():
+                magazine._add_articles(group)
+            for magazine, group in by_magazine.items():
+                if magazine._catalog._articles is not None:
+                    magazine._catalog._articles.extend(group)
+                for listener in magazine._catalog._listeners:
+                    listener.articles_added(group)
+        return articles
+
+    def delete(self):
+        """Removes the article from its author, its magazine and its catalog, and drops
+        its references to them"""
+        with _lock:
+            if self._author is None:
+                return
+            catalog = self._magazine._catalog
+            # Listeners see the article still linked, as they do for a move
+            for listener in catalog._listeners:
+                listener.article_removed(self)
+            self._author._remove_article(self)
+            self._magazine._remove_article(self)
+            if catalog._articles is not None:
+                catalog._articles.discard(self)
+            self._author = None
+            self._magazine = None
+
+    @classmethod
+    def find_by_title_prefix(cls, prefix):
+        """Returns a read-only list of registered articles whose title starts with prefix"""
+        return cls.all_articles.by_title_prefix(prefix)
+
+    @staticmethod
+    def _check_title(value):
+        if not isinstance(value, str):
+            raise ValueError("Title must be a string")
+        if len(value) < 5 or len(value) > 50:
+            raise ValueError("Title must be between 5 and 50 characters")
+
+    @staticmethod
+    def _check_author(value):
+        if not isinstance(value, Author):
+            raise ValueError("Author must be an instance of Author class")
+
+    @staticmethod
+    def _check_magazine(value):
+        if not isinstance(value, Magazine):
+            raise ValueError("Magazine must be an instance of Magazine class")
 
     @property
     def title(self):
@@ -152,23 +1089,41 @@ class Article:
 
     @title.setter
     def title(self, value):
-        if not isinstance(value, str):
-            raise ValueError("Title must be a string")
-        if len(value) < 5 or len(value) > 50:
-            raise ValueError("Title must be between 5 and 50 characters")
-        if hasattr(self, "_title") and self._title is not None:
+        self._check_title(value)
+        if self._title is not None:
             raise AttributeError("Title cannot be changed after instantiation")
         self._title = value
 
+    @property
+    def created_at(self):
+        return self._created  # seconds since the epoch
+
     @property
     def author(self):
         return self._author
 
     @author.setter
     def author(self, value):
-        if not isinstance(value, Author):
-            raise ValueError("Author must be an instance of Author class")
-        self._author = value
+        self._check_author(value)
+        with _lock:
+            previous = self._author
+            if previous is None and self._title is not None:
+                raise AttributeError("Article has been deleted")
+            if previous is None or previous is value:
+                self._author = value
+                return
+            listeners = self._magazine._catalog._listeners
+            for listener in listeners:
+                listener.article_removed(self)
+            self._author = value
+            # Move the article so author.articles() stays the single source of truth
+            previous._remove_article(self)
+            value._add_article(self)
+            self._magazine._count_author(previous, -1)
+            self._magazine._count_author(value, 1)
+            self._magazine._invalidate()
+            for listener in listeners:
+                listener.articles_added((self,))
 
     @property
     def magazine(self):
@@ -176,6 +1131,24 @@ class Article:
 
     @magazine.setter
     def magazine(self, value):
-        if not isinstance(value, Magazine):
-            raise ValueError("Magazine must be an instance of Magazine class")
-        self._magazine = value
+        self._check_magazine(value)
+        with _lock:
+            previous = self._magazine
+            if previous is None and self._title is not None:
+                raise AttributeError("Article has been deleted")
+            if previous is None or previous is value:
+                self._magazine = value
+                return
+            for listener in previous._catalog._listeners:
+                listener.article_removed(self)
+            self._magazine = value
+            previous._remove_article(self)
+            value._add_article(self)
+            self._author._invalidate()
+            if value._catalog is not previous._catalog:
+                if previous._catalog._articles is not None:
+                    previous._catalog._articles.discard(self)
+                if value._catalog._articles is not None:
+                    value._catalog._articles.append(self)
+            for listener in value._catalog._listeners:
+                listener.articles_added((self,))
@@ -0,0 +1,304 @@
+"""Full-text search over article titles.
+
+TitleIndex is an inverted index. It maps every lowercased word in a title to
+an ascending array of article IDs, where an ID is the article's position in
+the index. Queries with several words intersect those arrays. The shortest
+array is walked, and the others are probed by bisection, so a query costs
+time in proportion to its rarest word rather than to the number of articles.
+
+The index subscribes to a catalog, so it updates as articles are created or
+deleted. A removed article leaves a gap in the IDs, and once gaps outnumber
+live articles the index is renumbered, so moves and deletes do not grow it
+without bound. It can also be saved to a compact file and loaded back.
+"""
+import heapq
+import re
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+
+from .many_to_many import CatalogListener, current_catalog
+
+MAGIC = b"M2MTIDX1"
+_SECTIONS = ("word_offsets", "words", "posting_offsets", "postings")
+# Magic, byte order, article count, then an (offset, length) pair for every section
+_HEADER = struct.Struct("<8s8sQ" + "QQ" * len(_SECTIONS))
+_WORD = re.compile(r"\w+")
+_RANK_BY = ("magazine", "author")
+# Removed articles tolerated before the index is renumbered, however small it is
+_COMPACT_AFTER = 64
+
+
+def words(text):
+    """Returns the lowercased words of a title or query"""
+    return _WORD.findall(text.lower())
+
+
+def _contains_run(haystack, needle):
+    width = len(needle)
+    return any(haystack[start : start + width] == needle for start in range(len(haystack) - width + 1))
+
+
+def _unique(ids):
+    previous = None
+    for article_id in ids:
+        if article_id != previous:
+            yield article_id
+            previous = article_id
+
+
+class TitleIndex(CatalogListener):
+    """An inverted index over the titles of a catalog's articles"""
+
+    def __init__(self, catalog=None):
+        self._reset()
+        self.follow(catalog or current_catalog())
+
+    def _reset(self):
+        self._articles = []  # article ID -> article, or None once deleted
+        self._ids = {}  # live article -> its ID
+        self._postings = {}  # word -> array of article IDs, ascending
+        self._words = []  # sorted vocabulary, for prefix queries
+        self._new_words = []  # words added since the vocabulary was last sorted
+        self._live = 0
+        self._lock = threading.Lock()
+        self._catalog = None
+
+    def __len__(self):
+        return self._live
+
+    def follow(self, catalog):
+        """Indexes the catalog's articles and keeps up with its later changes"""
+        catalog.subscribe(self, replay=True)
+        self._catalog = catalog
+
+    def close(self):
+        """Stops following the catalog"""
+        if self._catalog is not None:
+            self._catalog.unsubscribe(self)
+            self._catalog = None
+
+    def articles_added(self, articles):
+        """Indexes new articles; called by the catalog"""
+        with self._lock:
+            postings = self._postings
+            for article in articles:
+                article_id = self._ids[article] = len(self._articles)
+                self._articles.append(article)
+                for word in dict.fromkeys(words(article.title)):
+                    posting = postings.get(word)
+                    if posting is None:
+                        posting = postings[word] = array("I")
+                        self._new_words.append(word)
+                    posting.append(article_id)
+            self._live += len(articles)
+
+    def article_removed(self, article):
+        """Drops a deleted article from the results; called by the catalog"""
+        with self._lock:
+            article_id = self._ids.pop(article, None)
+            if article_id is not None:
+                # IDs stay in the postings and are skipped when results are resolved
+                self._articles[article_id] = None
+                self._live -= 1
+                if len(self._articles) - self._live > max(_COMPACT_AFTER, self._live):
+                    self._compact()
+
+    def _renumbered(self):
+        # The live articles, and postings with their IDs renumbered to close the gaps
+        articles = self._articles
+        renumbered = array("I", [0]) * len(articles)
+        live = []
+        for article_id, article in enumerate(articles):
+            if article is not None:
+                renumbered[article_id] = len(live)
+                live.append(article)
+        postings = {}
+        for word, posting in self._postings.items():
+            kept = array("I", [renumbered[article_id] for article_id in posting if articles[article_id] is not None])
+            if kept:
+                postings[word] = kept
+        return live, postings
+
+    def _compact(self):
+        # Called with the lock held. Builds new lists rather than editing the old
+        # ones, so a query that took its view before still reads consistent data
+        live, postings = self._renumbered()
+        self._articles = live
+        self._ids = {article: article_id for article_id, article in enumerate(live)}
+        self._postings = postings
+        self._words = sorted(postings)
+        self._new_words = []
+
+    def _view(self):
+        # The articles and postings a query works on; compaction replaces both together
+        with self._lock:
+            return self._articles, self._postings
+
+    def _vocabulary(self):
+        if self._new_words:
+            with self._lock:
+                self._words = sorted(self._words + self._new_words)
+                self._new_words = []
+        return self._words
+
+    def _matching(self, query_words, postings):
+        # IDs of articles containing every word, ascending
+        postings = [postings.get(word) for word in dict.fromkeys(query_words)]
+        if not postings or None in postings:
+            return iter(())
+        postings.sort(key=len)
+        shortest, others = postings[0], postings[1:]
+        return (
+            article_id
+            for article_id in shortest
+            if all(_has(posting, article_id) for posting in others)
+        )
+
+    def _prefixed(self, prefix, postings):
+        # IDs of articles containing a word that starts with prefix, ascending
+        vocabulary = self._vocabulary()
+        start = end = bisect_left(vocabulary, prefix)
+        while end < len(vocabulary) and vocabulary[end].startswith(prefix):
+            end += 1
+        # The vocabulary may be newer than the postings if the index was compacted
+        matched = (postings.get(word) for word in vocabulary[start:end])
+        return _unique(heapq.merge(*(posting for posting in matched if posting is not None)))
+
+    def _resolve(self, ids, articles, limit, accept=None):
+        found = []
+        if limit is not None and limit <= 0:
+            return found
+        for article_id in ids:
+            article = articles[article_id]
+            if article is not None and (accept is None or accept(article)):
+                found.append(article)
+                if len(found) == limit:
+                    break
+        return found
+
+    def search(self, query, limit=None):
+        """Returns up to limit articles whose titles contain every word of the query,
+        in the order they were indexed"""
+        articles, postings = self._view()
+        return self._resolve(self._matching(words(query), postings), articles, limit)
+
+    def search_prefix(self, query, limit=None):
+        """Returns up to limit articles whose titles contain every word of the query,
+        treating the last word as a prefix (for search as you type)"""
+        query_words = words(query)
+        if not query_words:
+            return []
+        articles, postings = self._view()
+        ids = self._prefixed(query_words[-1], postings)
+        if len(query_words) > 1:
+            others = [postings.get(word) for word in query_words[:-1]]
+            if None in others:
+                return []
+            ids = (article_id for article_id in ids if all(_has(posting, article_id) for posting in others))
+        return self._resolve(ids, articles, limit)
+
+    def search_phrase(self, phrase, limit=None):
+        """Returns up to limit articles whose titles contain the phrase's words in order"""
+        phrase_words = words(phrase)
+        articles, postings = self._view()
+        return self._resolve(
+            self._matching(phrase_words, postings),
+            articles,
+            limit,
+            lambda article: _contains_run(words(article.title), phrase_words),
+        )
+
+    @staticmethod
+    def rank(articles, by="magazine"):
+        """Returns (magazine or author, matching articles) pairs for search results, most
+        matches first; ties keep the order in which they were first matched"""
+        if by not in _RANK_BY:
+            raise ValueError("by must be 'magazine' or 'author'")
+        counts = {}
+        for article in articles:
+            owner = getattr(article, by)
+            counts[owner] = counts.get(owner, 0) + 1
+        return sorted(counts.items(), key=lambda pair: -pair[1])
+
+    def articles(self):
+        """Returns the indexed articles in ID order, without deleted ones"""
+        return [article for article in self._articles if article is not None]
+
+    def save(self, path):
+        """Writes the index to a file. Articles are numbered in the order of articles()"""
+        with self._lock:
+            articles, postings = self._renumbered()
+        count = len(articles)
+        tables = {
+            "word_offsets": array("I", [0]),
+            "words": bytearray(),
+            "posting_offsets": array("Q", [0]),
+            "postings": array("I"),
+        }
+        for word in sorted(postings):
+            tables["words"].extend(word.encode("utf-8"))
+            tables["word_offsets"].append(len(tables["words"]))
+            tables["postings"].extend(postings[word])
+            tables["posting_offsets"].append(len(tables["postings"]))
+
+        with open(path, "wb") as file:
+            file.write(b"\0" * _HEADER.size)
+            positions = []
+            for name in _SECTIONS:
+                data = tables[name]
+                data = data.tobytes() if isinstance(data, array) else bytes(data)
+                positions.extend((file.tell(), len(data)))
+                file.write(data)
+                file.write(b"\0" * (-file.tell() % 8))
+            file.seek(0)
+            file.write(_HEADER.pack(MAGIC, sys.byteorder.encode().ljust(8, b"\0"), count, *positions))
+
+    @classmethod
+    def load(cls, path, articles, catalog=None):
+        """Reads an index written by save(). articles must be in the order articles()
+        returned when it was saved; they can be live articles or snapshot views. With
+        a catalog, the loaded index also follows that catalog's later changes"""
+        with open(path, "rb") as file:
+            data = file.read()
+        magic, byteorder, count, *positions = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a title index file")
+        if byteorder.rstrip(b"\0").decode() != sys.byteorder:
+            raise ValueError("Title index was written on a machine with a different byte order")
+        articles = list(articles)
+        if len(articles) != count:
+            raise ValueError(f"Title index has {count} articles but {len(articles)} were passed in")
+
+        sections = {}
+        for index, name in enumerate(_SECTIONS):
+            offset, length = positions[2 * index : 2 * index + 2]
+            sections[name] = data[offset : offset + length]
+        word_offsets = array("I")
+        word_offsets.frombytes(sections["word_offsets"])
+        posting_offsets = array("Q")
+        posting_offsets.frombytes(sections["posting_offsets"])
+        postings = array("I")
+        postings.frombytes(sections["postings"])
+        vocabulary = sections["words"]
+
+        index = cls.__new__(cls)
+        index._reset()
+        index._articles = articles
+        index._ids = {article: article_id for article_id, article in enumerate(articles)}
+        index._live = count
+        for number in range(len(word_offsets) - 1):
+            word = str(vocabulary[word_offsets[number] : word_offsets[number + 1]], "utf-8")
+            index._postings[word] = postings[posting_offsets[number] : posting_offsets[number + 1]]
+            index._words.append(word)
+        if catalog is not None:
+            catalog.subscribe(index)
+            index._catalog = catalog
+        return index
+
+
+def _has(posting, article_id):
+    position = bisect_left(posting, article_id)
+    return position < len(posting) and posting[position] == article_id
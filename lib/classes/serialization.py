@@ -0,0 +1,111 @@
+"""Streaming import and export of the Author/Magazine/Article graph.
+
+Each record is one article: its author's name, its magazine's name and category,
+and its title. Records are read and written one at a time as CSV or JSON Lines,
+so files far larger than memory can be processed.
+"""
+import csv
+import json
+
+from .many_to_many import Article, Author, BulkValidationError, Magazine
+
+FIELDS = ("author", "magazine", "category", "title")
+
+
+def _format_of(path, format):
+    if format is None:
+        format = "jsonl" if str(path).endswith((".jsonl", ".ndjson")) else "csv"
+    if format not in ("csv", "jsonl"):
+        raise ValueError("Format must be 'csv' or 'jsonl'")
+    return format
+
+
+def read_records(path, format=None):
+    """Yields each record in the file as a dict with the keys in FIELDS"""
+    format = _format_of(path, format)
+    with open(path, newline="" if format == "csv" else None, encoding="utf-8") as file:
+        if format == "csv":
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _batches(records, size):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def load(path, format=None, authors=None, magazines=None, batch_size=10_000):
+    """Creates the articles described in the file, reusing authors and magazines by name.
+    Pass existing name -> instance dicts as authors/magazines to merge into them.
+    Returns the (authors, magazines) dicts"""
+    authors = {} if authors is None else authors
+    magazines = {} if magazines is None else magazines
+
+    offset = 0
+    for batch in _batches(read_records(path, format), batch_size):
+        rows = []
+        for index, record in enumerate(batch, offset):
+            try:
+                author = authors.get(record["author"])
+                if author is None:
+                    author = authors[record["author"]] = Author(record["author"])
+                magazine = magazines.get(record["magazine"])
+                if magazine is None:
+                    magazine = magazines[record["magazine"]] = Magazine(
+                        record["magazine"], record["category"]
+                    )
+                title = record["title"]
+            except (KeyError, TypeError, ValueError) as error:
+                # TypeError: a JSON Lines record that is not an object
+                raise ValueError(f"Invalid record at row {index}: {error}") from error
+            rows.append((author, magazine, title))
+
+        try:
+            Article.from_records(rows)
+        except BulkValidationError as error:
+            raise BulkValidationError(
+                [(index + offset, message) for index, message in error.errors]
+            ) from None
+        offset += len(batch)
+
+    return authors, magazines
+
+
+def iter_records(articles):
+    """Yields a record dict for each article"""
+    for article in articles:
+        magazine = article.magazine
+        yield {
+            "author": article.author.name,
+            "magazine": magazine.name,
+            "category": magazine.category,
+            "title": article.title,
+        }
+
+
+def export(articles, path, format=None):
+    """Writes a record for each article to the file. Returns the number written"""
+    format = _format_of(path, format)
+    written = 0
+    with open(path, "w", newline="" if format == "csv" else None, encoding="utf-8") as file:
+        if format == "csv":
+            writer = csv.DictWriter(file, fieldnames=FIELDS)
+            writer.writeheader()
+            for record in iter_records(articles):
+                writer.writerow(record)
+                written += 1
+        else:
+            for record in iter_records(articles):
+                file.write(json.dumps(record))
+                file.write("\n")
+                written += 1
+    return written
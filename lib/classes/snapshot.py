@@ -0,0 +1,303 @@
+"""Binary snapshots of the Author/Magazine/Article graph.
+
+A snapshot stores ID-indexed tables of 32-bit integers:
+
+- authors, with a name
+- magazines, with a name and a category
+- articles, with an author, a magazine and a title
+
+Names, categories and titles go into a shared string table. Articles are
+grouped by author, and a second table lists each magazine's articles in
+publication order. That lets both sides of the relationship be read as
+slices.
+
+Snapshot opens the file through mmap and reads rows only when they are
+asked for, so a restart can answer author.articles() and
+magazine.contributors() without building the whole graph.
+"""
+import mmap
+import struct
+import sys
+from array import array
+
+from .many_to_many import Article, Author, Magazine
+
+MAGIC = b"M2MSNAP1"
+_SECTIONS = (
+    "string_offsets",
+    "strings",
+    "author_names",
+    "magazine_names",
+    "magazine_categories",
+    "author_offsets",
+    "article_authors",
+    "article_magazines",
+    "article_titles",
+    "magazine_offsets",
+    "magazine_articles",
+)
+# Magic, byte order, then an (offset, length) pair for every section
+_HEADER = struct.Struct("<8s8s" + "QQ" * len(_SECTIONS))
+
+
+def _uint32_array(values=()):
+    table = array("I", values)
+    if table.itemsize != 4:
+        raise RuntimeError("Snapshots need a 4-byte unsigned int array type")
+    return table
+
+
+def save(path, authors, magazines):
+    """Writes the authors, magazines and all of their articles to a snapshot file"""
+    authors = list(authors)
+    magazines = list(magazines)
+    author_ids = {author: index for index, author in enumerate(authors)}
+    magazine_ids = {magazine: index for index, magazine in enumerate(magazines)}
+
+    strings = {}
+    blob = bytearray()
+    string_offsets = _uint32_array([0])
+
+    def intern(value):
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+            blob.extend(value.encode("utf-8"))
+            string_offsets.append(len(blob))
+        return index
+
+    tables = {name: _uint32_array() for name in _SECTIONS if name not in ("string_offsets", "strings")}
+    for author in authors:
+        tables["author_names"].append(intern(author.name))
+    for magazine in magazines:
+        tables["magazine_names"].append(intern(magazine.name))
+        tables["magazine_categories"].append(intern(magazine.category))
+
+    article_ids = {}
+    tables["author_offsets"].append(0)
+    for author_id, author in enumerate(authors):
+        for article in author.articles():
+            if article.magazine not in magazine_ids:
+                raise ValueError(f"Magazine {article.magazine.name!r} is not in the snapshot")
+            article_ids[article] = len(article_ids)
+            tables["article_authors"].append(author_id)
+            tables["article_magazines"].append(magazine_ids[article.magazine])
+            tables["article_titles"].append(intern(article.title))
+        tables["author_offsets"].append(len(article_ids))
+
+    tables["magazine_offsets"].append(0)
+    for magazine in magazines:
+        for article in magazine.articles():
+            if article not in article_ids:
+                raise ValueError(f"Author {article.author.name!r} is not in the snapshot")
+            tables["magazine_articles"].append(article_ids[article])
+        tables["magazine_offsets"].append(len(tables["magazine_articles"]))
+
+    tables["string_offsets"] = string_offsets
+    tables["strings"] = blob
+
+    with open(path, "wb") as file:
+        file.write(b"\0" * _HEADER.size)
+        positions = []
+        for name in _SECTIONS:
+            data = tables[name]
+            data = data.tobytes() if isinstance(data, array) else bytes(data)
+            positions.extend((file.tell(), len(data)))
+            file.write(data)
+            file.write(b"\0" * (-file.tell() % 8))  # keep every section 8-byte aligned
+        file.seek(0)
+        file.write(_HEADER.pack(MAGIC, sys.byteorder.encode().ljust(8, b"\0"), *positions))
+
+
+class Snapshot:
+    """A read-only, memory-mapped view of a snapshot file"""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, byteorder, *positions = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError("Not a snapshot file")
+        if byteorder.rstrip(b"\0").decode() != sys.byteorder:
+            self._mmap.close()
+            raise ValueError("Snapshot was written on a machine with a different byte order")
+
+        view = memoryview(self._mmap)
+        self._views = [view]
+        for index, name in enumerate(_SECTIONS):
+            offset, length = positions[2 * index : 2 * index + 2]
+            section = view[offset : offset + length]
+            if name != "strings":
+                section = section.cast("I")
+            self._views.append(section)
+            setattr(self, "_" + name, section)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Releases the memory map; views taken from the snapshot stop working"""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def _string(self, index):
+        return str(self._strings[self._string_offsets[index] : self._string_offsets[index + 1]], "utf-8")
+
+    @property
+    def author_count(self):
+        return len(self._author_names)
+
+    @property
+    def magazine_count(self):
+        return len(self._magazine_names)
+
+    @property
+    def article_count(self):
+        return len(self._article_titles)
+
+    def author(self, author_id):
+        """Returns a lazy view of the author with this ID"""
+        if not 0 <= author_id < self.author_count:
+            raise IndexError("Author ID out of range")
+        return SnapshotAuthor(self, author_id)
+
+    def magazine(self, magazine_id):
+        """Returns a lazy view of the magazine with this ID"""
+        if not 0 <= magazine_id < self.magazine_count:
+            raise IndexError("Magazine ID out of range")
+        return SnapshotMagazine(self, magazine_id)
+
+    def article(self, article_id):
+        """Returns a lazy view of the article with this ID"""
+        if not 0 <= article_id < self.article_count:
+            raise IndexError("Article ID out of range")
+        return SnapshotArticle(self, article_id)
+
+    def authors(self):
+        """Yields a lazy view of every author"""
+        return (SnapshotAuthor(self, index) for index in range(self.author_count))
+
+    def magazines(self):
+        """Yields a lazy view of every magazine"""
+        return (SnapshotMagazine(self, index) for index in range(self.magazine_count))
+
+    def materialize(self):
+        """Builds live Author, Magazine and Article instances from the whole snapshot.
+        Returns the (authors, magazines) lists in snapshot ID order"""
+        authors = [Author(self._string(name)) for name in self._author_names]
+        magazines = [
+            Magazine(self._string(name), self._string(category))
+            for name, category in zip(self._magazine_names, self._magazine_categories)
+        ]
+        # Recreate articles in each magazine's publication order; an author's
+        # articles come back grouped by magazine rather than in their original order
+        Article.from_records(
+            (authors[self._article_authors[index]], magazines[magazine_id], self._string(self._article_titles[index]))
+            for magazine_id in range(self.magazine_count)
+            for index in self._magazine_articles[self._magazine_offsets[magazine_id] : self._magazine_offsets[magazine_id + 1]]
+        )
+        return authors, magazines
+
+
+class _SnapshotRecord:
+    __slots__ = ("_snapshot", "id")
+
+    def __init__(self, snapshot, record_id):
+        self._snapshot = snapshot
+        self.id = record_id
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other._snapshot is self._snapshot and other.id == self.id
+
+    def __hash__(self):
+        return hash((type(self), self.id))
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.id}>"
+
+
+class SnapshotAuthor(_SnapshotRecord):
+    """An author read on demand from a Snapshot"""
+
+    __slots__ = ()
+
+    @property
+    def name(self):
+        return self._snapshot._string(self._snapshot._author_names[self.id])
+
+    def _article_ids(self):
+        offsets = self._snapshot._author_offsets
+        return range(offsets[self.id], offsets[self.id + 1])
+
+    def articles(self):
+        """Returns a list of all articles the author has written"""
+        return [SnapshotArticle(self._snapshot, index) for index in self._article_ids()]
+
+    def magazines(self):
+        """Returns a unique list of magazines for which the author has contributed to"""
+        magazine_ids = self._snapshot._article_magazines
+        unique = dict.fromkeys(magazine_ids[index] for index in self._article_ids())
+        return [SnapshotMagazine(self._snapshot, magazine_id) for magazine_id in unique]
+
+    def topic_areas(self):
+        """Returns a unique list of categories of the magazines the author has contributed to"""
+        if not self._article_ids():
+            return None
+        return list(dict.fromkeys(magazine.category for magazine in self.magazines()))
+
+
+class SnapshotMagazine(_SnapshotRecord):
+    """A magazine read on demand from a Snapshot"""
+
+    __slots__ = ()
+
+    @property
+    def name(self):
+        return self._snapshot._string(self._snapshot._magazine_names[self.id])
+
+    @property
+    def category(self):
+        return self._snapshot._string(self._snapshot._magazine_categories[self.id])
+
+    def _article_ids(self):
+        offsets = self._snapshot._magazine_offsets
+        return self._snapshot._magazine_articles[offsets[self.id] : offsets[self.id + 1]]
+
+    def articles(self):
+        """Returns a list of all the articles the magazine has published"""
+        return [SnapshotArticle(self._snapshot, index) for index in self._article_ids()]
+
+    def contributors(self):
+        """Returns a unique list of authors who have written for this magazine"""
+        author_ids = self._snapshot._article_authors
+        unique = dict.fromkeys(author_ids[index] for index in self._article_ids())
+        return [SnapshotAuthor(self._snapshot, author_id) for author_id in unique]
+
+    def article_titles(self):
+        """Returns a list of titles of all articles written for that magazine"""
+        titles = [article.title for article in self.articles()]
+        return titles if titles else None
+
+
+class SnapshotArticle(_SnapshotRecord):
+    """An article read on demand from a Snapshot"""
+
+    __slots__ = ()
+
+    @property
+    def title(self):
+        return self._snapshot._string(self._snapshot._article_titles[self.id])
+
+    @property
+    def author(self):
+        return SnapshotAuthor(self._snapshot, self._snapshot._article_authors[self.id])
+
+    @property
+    def magazine(self):
+        return SnapshotMagazine(self._snapshot, self._snapshot._article_magazines[self.id])
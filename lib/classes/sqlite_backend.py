@@ -0,0 +1,364 @@
+"""SQLite storage for the Author/Magazine/Article model.
+
+SQLiteCatalog persists authors, magazines and articles to a local database
+file. It applies the same validation as the in-memory classes. Its
+StoredAuthor, StoredMagazine and StoredArticle records have the same query
+methods as Author, Magazine and Article, but each relationship is loaded
+lazily with an indexed query when it is called. Nothing is cached in
+process memory, so the catalog does not grow with the data. As in the model,
+only a magazine's name and category can be changed; the new value is
+validated and written immediately.
+
+Connections come from a small pool. Every statement is a module-level
+constant, so sqlite3's per-connection statement cache prepares each query
+only once per connection.
+"""
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from .many_to_many import Article, Author, Magazine
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS authors (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS magazines (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    author_id INTEGER NOT NULL REFERENCES authors (id),
+    magazine_id INTEGER NOT NULL REFERENCES magazines (id),
+    title TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_by_author ON articles (author_id, magazine_id);
+CREATE INDEX IF NOT EXISTS articles_by_magazine ON articles (magazine_id, author_id);
+"""
+
+INSERT_AUTHOR = "INSERT INTO authors (name) VALUES (?)"
+INSERT_MAGAZINE = "INSERT INTO magazines (name, category) VALUES (?, ?)"
+INSERT_ARTICLE = "INSERT INTO articles (author_id, magazine_id, title) VALUES (?, ?, ?)"
+UPDATE_MAGAZINE_NAME = "UPDATE magazines SET name = ? WHERE id = ?"
+UPDATE_MAGAZINE_CATEGORY = "UPDATE magazines SET category = ? WHERE id = ?"
+SELECT_AUTHOR = "SELECT id, name FROM authors WHERE id = ?"
+SELECT_AUTHORS = "SELECT id, name FROM authors ORDER BY id"
+SELECT_MAGAZINE = "SELECT id, name, category FROM magazines WHERE id = ?"
+SELECT_MAGAZINES = "SELECT id, name, category FROM magazines ORDER BY id"
+SELECT_AUTHOR_ARTICLES = "SELECT id, author_id, magazine_id, title FROM articles WHERE author_id = ? ORDER BY id"
+SELECT_MAGAZINE_ARTICLES = "SELECT id, author_id, magazine_id, title FROM articles WHERE magazine_id = ? ORDER BY id"
+SELECT_AUTHOR_MAGAZINES = """
+    SELECT magazines.id, magazines.name, magazines.category
+    FROM articles JOIN magazines ON magazines.id = articles.magazine_id
+    WHERE articles.author_id = ?
+    GROUP BY magazines.id ORDER BY MIN(articles.id)
+"""
+SELECT_TOPIC_AREAS = """
+    SELECT magazines.category
+    FROM articles JOIN magazines ON magazines.id = articles.magazine_id
+    WHERE articles.author_id = ?
+    GROUP BY magazines.category ORDER BY MIN(articles.id)
+"""
+SELECT_CONTRIBUTORS = """
+    SELECT authors.id, authors.name
+    FROM articles JOIN authors ON authors.id = articles.author_id
+    WHERE articles.magazine_id = ?
+    GROUP BY authors.id HAVING COUNT(*) >= ? ORDER BY MIN(articles.id)
+"""
+SELECT_CONTRIBUTOR_COUNT = "SELECT COUNT(*) FROM articles WHERE magazine_id = ? AND author_id = ?"
+SELECT_TITLES = "SELECT title FROM articles WHERE magazine_id = ? ORDER BY id"
+SELECT_TOP_PUBLISHERS = """
+    SELECT magazines.id, magazines.name, magazines.category
+    FROM articles JOIN magazines ON magazines.id = articles.magazine_id
+    GROUP BY magazines.id ORDER BY COUNT(*) DESC, magazines.id LIMIT ?
+"""
+
+
+class ConnectionPool:
+    """Hands out up to size connections to one SQLite database file"""
+
+    def __init__(self, path, size=4):
+        self._path = str(path)
+        self._size = size
+        self._idle = queue.LifoQueue()  # idle connections, or None once the pool is closed
+        self._created = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        connection = sqlite3.connect(self._path, check_same_thread=False, cached_statements=256)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA foreign_keys = ON")
+        return connection
+
+    @contextmanager
+    def connection(self):
+        """Borrows a connection, waiting for one to be returned if all are in use.
+        Raises ValueError once the pool is closed"""
+        if self._closed:
+            raise ValueError("Connection pool is closed")
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self._size
+                if create:
+                    self._created += 1
+            connection = self._connect() if create else self._idle.get()
+        if connection is None:
+            self._idle.put(None)  # passes the wake-up on to the next waiter
+            raise ValueError("Connection pool is closed")
+        try:
+            yield connection
+        finally:
+            with self._lock:
+                if self._closed:
+                    connection.close()
+                else:
+                    self._idle.put(connection)
+
+    def close(self):
+        """Closes every idle connection now and each borrowed one when it is returned"""
+        with self._lock:
+            self._closed = True
+            while True:
+                try:
+                    connection = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if connection is not None:
+                    connection.close()
+            # Wakes every borrower waiting for a connection, which then raises
+            self._idle.put(None)
+
+
+class SQLiteCatalog:
+    """Authors, magazines and articles persisted in a SQLite database file"""
+
+    def __init__(self, path, pool_size=4):
+        self._pool = ConnectionPool(path, pool_size)
+        with self._pool.connection() as connection:
+            connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._pool.close()
+
+    def _fetch(self, sql, parameters=()):
+        with self._pool.connection() as connection:
+            return connection.execute(sql, parameters).fetchall()
+
+    def _insert(self, sql, parameters):
+        with self._pool.connection() as connection, connection:
+            return connection.execute(sql, parameters).lastrowid
+
+    def _update(self, sql, parameters):
+        with self._pool.connection() as connection, connection:
+            connection.execute(sql, parameters)
+
+    def add_author(self, name):
+        """Stores a new author and returns it"""
+        Author._check_name(name)
+        return StoredAuthor(self, self._insert(INSERT_AUTHOR, (name,)), name)
+
+    def add_magazine(self, name, category):
+        """Stores a new magazine and returns it"""
+        Magazine._check_name(name)
+        Magazine._check_category(category)
+        return StoredMagazine(self, self._insert(INSERT_MAGAZINE, (name, category)), name, category)
+
+    def add_article(self, author, magazine, title):
+        """Stores a new article for a stored author and magazine and returns it"""
+        if not isinstance(author, StoredAuthor):
+            raise ValueError("Author must be a StoredAuthor")
+        if not isinstance(magazine, StoredMagazine):
+            raise ValueError("Magazine must be a StoredMagazine")
+        Article._check_title(title)
+        article_id = self._insert(INSERT_ARTICLE, (author.id, magazine.id, title))
+        return StoredArticle(self, article_id, author.id, magazine.id, title)
+
+    def save(self, authors, magazines):
+        """Stores in-memory authors and magazines with all of their articles in one
+        transaction. Returns {instance: stored record} for the authors and magazines"""
+        stored = {}
+        with self._pool.connection() as connection, connection:
+            for author in authors:
+                stored[author] = StoredAuthor(
+                    self, connection.execute(INSERT_AUTHOR, (author.name,)).lastrowid, author.name
+                )
+            for magazine in magazines:
+                stored[magazine] = StoredMagazine(
+                    self,
+                    connection.execute(INSERT_MAGAZINE, (magazine.name, magazine.category)).lastrowid,
+                    magazine.name,
+                    magazine.category,
+                )
+            for magazine in magazines:
+                rows = []
+                for article in magazine.articles():
+                    if article.author not in stored:
+                        raise ValueError(f"Author {article.author.name!r} was not passed in")
+                    rows.append((stored[article.author].id, stored[magazine].id, article.title))
+                connection.executemany(INSERT_ARTICLE, rows)
+        return stored
+
+    def author(self, author_id):
+        """Returns the stored author with this ID, or None"""
+        rows = self._fetch(SELECT_AUTHOR, (author_id,))
+        return StoredAuthor(self, *rows[0]) if rows else None
+
+    def magazine(self, magazine_id):
+        """Returns the stored magazine with this ID, or None"""
+        rows = self._fetch(SELECT_MAGAZINE, (magazine_id,))
+        return StoredMagazine(self, *rows[0]) if rows else None
+
+    def authors(self):
+        """Returns every stored author"""
+        return [StoredAuthor(self, *row) for row in self._fetch(SELECT_AUTHORS)]
+
+    def magazines(self):
+        """Returns every stored magazine"""
+        return [StoredMagazine(self, *row) for row in self._fetch(SELECT_MAGAZINES)]
+
+    def top_publisher(self):
+        """Returns the stored magazine with the most articles, or None if there are no articles"""
+        top = self.top_publishers(1)
+        return top[0] if top else None
+
+    def top_publishers(self, k):
+        """Returns up to k stored magazines with the most articles, in descending order"""
+        return [StoredMagazine(self, *row) for row in self._fetch(SELECT_TOP_PUBLISHERS, (max(k, 0),))]
+
+
+class _StoredRecord:
+    __slots__ = ("_catalog", "id")
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other._catalog is self._catalog and other.id == self.id
+
+    def __hash__(self):
+        return hash((type(self), self.id))
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.id}>"
+
+
+class StoredAuthor(_StoredRecord):
+    """An author row; relationships are queried when called"""
+
+    __slots__ = ("_name",)
+
+    def __init__(self, catalog, author_id, name):
+        self._catalog = catalog
+        self.id = author_id
+        self._name = name
+
+    @property
+    def name(self):
+        return self._name
+
+    def articles(self):
+        """Returns a list of all articles the author has written"""
+        return [StoredArticle(self._catalog, *row) for row in self._catalog._fetch(SELECT_AUTHOR_ARTICLES, (self.id,))]
+
+    def magazines(self):
+        """Returns a unique list of magazines for which the author has contributed to"""
+        return [StoredMagazine(self._catalog, *row) for row in self._catalog._fetch(SELECT_AUTHOR_MAGAZINES, (self.id,))]
+
+    def topic_areas(self):
+        """Returns a unique list of categories of the magazines the author has contributed to"""
+        categories = [row[0] for row in self._catalog._fetch(SELECT_TOPIC_AREAS, (self.id,))]
+        return categories if categories else None
+
+
+class StoredMagazine(_StoredRecord):
+    """A magazine row; relationships are queried when called"""
+
+    __slots__ = ("_name", "_category")
+
+    def __init__(self, catalog, magazine_id, name, category):
+        self._catalog = catalog
+        self.id = magazine_id
+        self._name = name
+        self._category = category
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        Magazine._check_name(value)
+        self._catalog._update(UPDATE_MAGAZINE_NAME, (value, self.id))
+        self._name = value
+
+    @property
+    def category(self):
+        return self._category
+
+    @category.setter
+    def category(self, value):
+        Magazine._check_category(value)
+        self._catalog._update(UPDATE_MAGAZINE_CATEGORY, (value, self.id))
+        self._category = value
+
+    def articles(self):
+        """Returns a list of all the articles the magazine has published"""
+        return [StoredArticle(self._catalog, *row) for row in self._catalog._fetch(SELECT_MAGAZINE_ARTICLES, (self.id,))]
+
+    def contributors(self):
+        """Returns a unique list of authors who have written for this magazine"""
+        return self._authors_with(1)
+
+    def _authors_with(self, min_articles):
+        rows = self._catalog._fetch(SELECT_CONTRIBUTORS, (self.id, min_articles))
+        return [StoredAuthor(self._catalog, *row) for row in rows]
+
+    def contributor_count(self, author):
+        """Returns the number of articles the author has written for this magazine"""
+        return self._catalog._fetch(SELECT_CONTRIBUTOR_COUNT, (self.id, author.id))[0][0]
+
+    def article_titles(self):
+        """Returns a list of titles of all articles written for that magazine"""
+        titles = [row[0] for row in self._catalog._fetch(SELECT_TITLES, (self.id,))]
+        return titles if titles else None
+
+    def contributing_authors(self, min_articles=3):
+        """Returns a list of authors who have written at least min_articles
+        (by default more than 2) articles for the magazine"""
+        authors = self._authors_with(min_articles)
+        return authors if authors else None
+
+
+class StoredArticle(_StoredRecord):
+    """An article row; its author and magazine are queried when accessed"""
+
+    __slots__ = ("_author_id", "_magazine_id", "_title")
+
+    def __init__(self, catalog, article_id, author_id, magazine_id, title):
+        self._catalog = catalog
+        self.id = article_id
+        self._author_id = author_id
+        self._magazine_id = magazine_id
+        self._title = title
+
+    @property
+    def title(self):
+        return self._title
+
+    @property
+    def author(self):
+        return self._catalog.author(self._author_id)
+
+    @property
+    def magazine(self):
+        return self._catalog.magazine(self._magazine_id)
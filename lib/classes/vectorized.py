@@ -0,0 +1,145 @@
+"""Optional NumPy engine for bulk author and magazine statistics.
+
+VectorEngine copies the graph into integer arrays with one entry per article.
+The arrays hold the author ID, the magazine ID, the magazine's category ID,
+and the article's position in its author's list. Queries over every author
+or magazine are answered with bincount, unique and argsort instead of Python
+loops.
+
+The engine is a snapshot. Build a new one after the graph changes.
+"""
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only this module needs it
+    np = None
+
+_UNREGISTERED = 1 << 62  # ranks magazines missing from their catalog after registered ones
+
+
+class VectorEngine:
+    """NumPy mirror of a set of authors and magazines"""
+
+    def __init__(self, authors, magazines):
+        if np is None:
+            raise ImportError("VectorEngine requires numpy (pipenv install numpy)")
+        self.authors = list(authors)
+        self.magazines = list(magazines)
+        author_index = {author: index for index, author in enumerate(self.authors)}
+
+        # Position of each article in its author's list, so author-side results
+        # can keep the same order as Author.magazines() and Author.topic_areas()
+        positions = {}
+        for author in self.authors:
+            for position, article in enumerate(author.articles()):
+                positions[article] = position
+
+        # Articles are stored magazine by magazine in publication order, so the first
+        # occurrence of an author within a magazine matches Magazine.contributors()
+        author_ids, magazine_ids, author_positions = [], [], []
+        for magazine_id, magazine in enumerate(self.magazines):
+            for article in magazine.articles():
+                author_id = author_index.get(article.author)
+                if author_id is None:
+                    raise ValueError(f"Author {article.author.name!r} was not passed in")
+                author_ids.append(author_id)
+                magazine_ids.append(magazine_id)
+                author_positions.append(positions[article])
+
+        self.author_ids = np.array(author_ids, dtype=np.int64)
+        self.magazine_ids = np.array(magazine_ids, dtype=np.int64)
+        self.author_positions = np.array(author_positions, dtype=np.int64)
+
+        self.categories = list(dict.fromkeys(magazine.category for magazine in self.magazines))
+        category_index = {category: index for index, category in enumerate(self.categories)}
+        self.magazine_categories = np.array(
+            [category_index[magazine.category] for magazine in self.magazines], dtype=np.int64
+        )
+        self.category_ids = self.magazine_categories[self.magazine_ids]
+
+        # Ties in the ranking go to the magazine registered first, as in
+        # Magazine.top_publishers; unregistered magazines follow in the order passed in
+        registration = []
+        for position, magazine in enumerate(self.magazines):
+            entry = magazine._catalog.magazines._entry(magazine)
+            registration.append(entry.sequence if entry is not None else _UNREGISTERED + position)
+        self.registration = np.array(registration, dtype=np.int64)
+
+    def article_counts(self):
+        """Returns an array with the number of articles in each magazine"""
+        return np.bincount(self.magazine_ids, minlength=len(self.magazines))
+
+    def _pairs(self):
+        # Unique (magazine, author) pairs with their counts and first occurrence
+        keys = self.magazine_ids * len(self.authors) + self.author_ids
+        unique, first, counts = np.unique(keys, return_index=True, return_counts=True)
+        return unique // len(self.authors), unique % len(self.authors), first, counts
+
+    def contributor_counts(self):
+        """Returns {magazine: {author: articles}} for every magazine, like Magazine.contributor_count"""
+        result = {magazine: {} for magazine in self.magazines}
+        if not len(self.author_ids):
+            return result
+        magazine_ids, author_ids, first, counts = self._pairs()
+        for index in np.argsort(first, kind="stable"):
+            result[self.magazines[magazine_ids[index]]][self.authors[author_ids[index]]] = int(counts[index])
+        return result
+
+    def contributing_authors(self, min_articles=3):
+        """Returns {magazine: Magazine.contributing_authors(min_articles)} for every magazine"""
+        result = {magazine: None for magazine in self.magazines}
+        if not len(self.author_ids):
+            return result
+        magazine_ids, author_ids, first, counts = self._pairs()
+        selected = np.flatnonzero(counts >= min_articles)
+        selected = selected[np.argsort(first[selected], kind="stable")]
+        grouped = {}
+        for index in selected:
+            grouped.setdefault(int(magazine_ids[index]), []).append(self.authors[author_ids[index]])
+        for magazine_id, authors in grouped.items():
+            result[self.magazines[magazine_id]] = tuple(authors)
+        return result
+
+    def top_publishers(self, k=None):
+        """Returns up to k magazines with articles, most articles first, like
+        Magazine.top_publishers(k)"""
+        counts = self.article_counts()
+        order = np.lexsort((self.registration, -counts))
+        order = order[counts[order] > 0]
+        if k is not None:
+            order = order[: max(k, 0)]
+        return [self.magazines[index] for index in order]
+
+    def top_publisher(self):
+        """Returns the magazine with the most articles, or None if there are no articles"""
+        top = self.top_publishers(1)
+        return top[0] if top else None
+
+    def category_histograms(self):
+        """Returns a (authors x categories) array counting each author's articles per
+        category; columns follow self.categories"""
+        width = len(self.categories)
+        flat = np.bincount(self.author_ids * width + self.category_ids, minlength=len(self.authors) * width)
+        return flat.reshape(len(self.authors), width)
+
+    def topic_areas(self):
+        """Returns {author: Author.topic_areas()} for every author"""
+        result = {author: None for author in self.authors}
+        if not len(self.author_ids):
+            return result
+        width = len(self.categories)
+        keys = self.author_ids * width + self.category_ids
+        # First article (by author position) of every (author, category) pair...
+        order = np.lexsort((self.author_positions, keys))
+        sorted_keys = keys[order]
+        is_first = np.ones(len(sorted_keys), dtype=bool)
+        is_first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+        first_keys = sorted_keys[is_first]
+        first_positions = self.author_positions[order][is_first]
+        # ...then each author's categories in the order they were first reached
+        order = np.lexsort((first_positions, first_keys // width))
+        grouped = {}
+        for key in first_keys[order]:
+            grouped.setdefault(int(key // width), []).append(self.categories[key % width])
+        for author_id, categories in grouped.items():
+            result[self.authors[author_id]] = tuple(categories)
+        return result
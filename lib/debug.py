@@ -1,9 +1,62 @@
 #!/usr/bin/env python3
-import ipdb
-from .classes.many_to_many import Article, Author, Magazine
+import argparse
+
+from .classes.many_to_many import Article, Author, Catalog, Magazine
+
+
+def workload(article_count):
+    """Builds a synthetic catalog and calls every public query on it"""
+    from .benchmarks.workload import build
+
+    with Catalog():
+        authors, magazines = build(article_count)
+        for author in authors:
+            author.magazines()
+            author.topic_areas()
+        for magazine in magazines:
+            magazine.contributors()
+            magazine.article_titles()
+            magazine.contributing_authors()
+        Magazine.top_publisher()
+        Magazine.top_publishers(10)
+        for index, author in enumerate(authors[:1000]):
+            author.add_article(magazines[index % len(magazines)], f"Debug article {index}")
+
+
+def profile(path, article_count):
+    """Runs the workload under cProfile with instrumentation on, writes the profile
+    to path and prints the costliest functions and the instrumentation stats"""
+    import cProfile
+    import pstats
+
+    from .classes import instrumentation
+
+    instrumentation.reset()
+    instrumentation.enable()
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(workload, article_count)
+    finally:
+        instrumentation.disable()
+    profiler.dump_stats(path)
+    pstats.Stats(path).sort_stats("cumulative").print_stats(20)
+    print(instrumentation.prometheus())
+    print(f"Profile written to {path}; inspect it with python -m pstats {path}")
+
 
 if __name__ == "__main__":
-    print("HELLO! :) let's debug :vibing_potato:")
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", metavar="PATH", help="profile a scripted workload and write cProfile output to PATH")
+    parser.add_argument("--articles", type=int, default=100_000, help="articles in the profiled workload")
+    options = parser.parse_args()
+
+    if options.profile:
+        profile(options.profile, options.articles)
+    else:
+        # Imported here so the profiling mode and importers of this module do not need ipdb
+        import ipdb
+
+        print("HELLO! :) let's debug :vibing_potato:")
 
-    # don't remove this line, it's for debugging!
-    ipdb.set_trace()
+        # don't remove this line, it's for debugging!
+        ipdb.set_trace()
@@ -0,0 +1,47 @@
+import pytest
+
+from lib.classes.analytics import compute_all, encode
+
+
+class TestAnalytics:
+    """Batch aggregations in analytics.py"""
+
+    def test_encode(self, synthetic_graph):
+        """encode returns one author and magazine ID per article"""
+        authors, magazines = synthetic_graph
+        author_ids, magazine_ids = encode(authors, magazines)
+        assert len(author_ids) == len(magazine_ids) == 80
+        assert author_ids.tobytes()  # compact array, not a list of objects
+
+    def test_encode_needs_every_owner(self, synthetic_graph):
+        """encode refuses articles whose author or magazine was not passed in"""
+        authors, magazines = synthetic_graph
+        for passed_authors, passed_magazines in ((authors[1:], magazines), (authors, magazines[1:])):
+            try:
+                encode(passed_authors, passed_magazines)
+                assert False, "Missing authors or magazines should raise exception"
+            except ValueError as error:
+                assert "was not passed in" in str(error)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_object_api(self, synthetic_graph, workers):
+        """compute_all agrees with the Author and Magazine methods"""
+        authors, magazines = synthetic_graph
+        result = compute_all(authors, magazines, workers=workers)
+
+        for author in authors:
+            assert set(result.magazines[author]) == set(author.magazines())
+            if author.topic_areas() is None:
+                assert result.topic_areas[author] is None
+            else:
+                assert set(result.topic_areas[author]) == set(author.topic_areas())
+        for magazine in magazines:
+            assert result.article_counts[magazine] == len(magazine.articles())
+            expected = magazine.contributing_authors()
+            if expected is None:
+                assert result.contributing_authors[magazine] is None
+            else:
+                assert set(result.contributing_authors[magazine]) == set(expected)
+
+        most = max(len(magazine.articles()) for magazine in magazines)
+        assert len(result.top_publisher.articles()) == most
@@ -1,5 +1,10 @@
-from lib.classes.many_to_many import Author, Magazine, Article
+import os
+import subprocess
+import sys
 
+from lib.classes.many_to_many import Author, Magazine, Article, BulkValidationError, Catalog
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 class TestArticle:
     """Class Article in many_to_many.py"""
@@ -87,3 +92,198 @@ class TestArticle:
         magazine = Magazine("Vogue", "Fashion")
         article = Article(author, magazine, "How to wear a tutu with style")
         assert isinstance(article.magazine, Magazine)
+
+    def test_changing_author_moves_article(self):
+        """changing the author moves the article between authors"""
+        author_1 = Author("Carry Bradshaw")
+        author_2 = Author("Nathaniel Holmes")
+        magazine = Magazine("Vogue", "Fashion")
+        article = Article(author_1, magazine, "How to wear a tutu with style")
+        assert magazine.contributors() == (author_1,)
+
+        article.author = author_2
+        assert article not in author_1.articles()
+        assert article in author_2.articles()
+        assert magazine.contributors() == (author_2,)
+
+    def test_changing_magazine_moves_article(self):
+        """changing the magazine moves the article between magazines"""
+        Magazine.all_magazines.clear()
+        author = Author("Carry Bradshaw")
+        magazine_1 = Magazine("Vogue", "Fashion")
+        magazine_2 = Magazine("AD", "Architecture")
+        article = Article(author, magazine_1, "How to wear a tutu with style")
+        assert Magazine.top_publisher() == magazine_1
+
+        article.magazine = magazine_2
+        assert magazine_1.article_titles() is None
+        assert magazine_2.article_titles() == ("How to wear a tutu with style",)
+        assert author.topic_areas() == ("Architecture",)
+        assert Magazine.top_publisher() == magazine_2
+
+    def test_articles_are_compact(self):
+        """articles do not carry a per-instance __dict__"""
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+        article = Article(author, magazine, "How to wear a tutu with style")
+        assert not hasattr(article, "__dict__")
+
+    def test_from_records(self):
+        """from_records creates and links every article"""
+        Magazine.all_magazines.clear()
+        author_1 = Author("Carry Bradshaw")
+        author_2 = Author("Nathaniel Holmes")
+        magazine_1 = Magazine("Vogue", "Fashion")
+        magazine_2 = Magazine("AD", "Architecture")
+
+        articles = Article.from_records(
+            [
+                (author_1, magazine_1, "Article 1"),
+                (author_2, magazine_2, "Article 2"),
+                (author_1, magazine_2, "Article 3"),
+            ]
+        )
+
+        assert [article.title for article in articles] == ["Article 1", "Article 2", "Article 3"]
+        assert author_1.articles() == [articles[0], articles[2]]
+        assert magazine_2.articles() == [articles[1], articles[2]]
+        assert magazine_2.contributor_count(author_1) == 1
+        assert Magazine.top_publisher() == magazine_2
+
+    def test_from_records_reports_every_invalid_row(self):
+        """from_records reports all invalid rows and creates nothing"""
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+
+        try:
+            Article.from_records(
+                [
+                    (author, magazine, "Article 1"),
+                    (author, magazine, "Hi"),
+                    ("Carry", magazine, "Article 3"),
+                    (author, magazine),
+                ]
+            )
+            assert False, "Invalid records should raise exception"
+        except BulkValidationError as error:
+            assert [index for index, _ in error.errors] == [1, 2, 3]
+            assert isinstance(error, ValueError)
+
+        assert author.articles() == []
+        assert magazine.articles() == []
+
+    def test_find_by_title_prefix(self):
+        """find_by_title_prefix returns articles sorted by title"""
+        Article.all_articles.clear()
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+        article_1 = Article(author, magazine, "How to wear a tutu with style")
+        Article(author, magazine, "Dating life in NYC")
+        assert Article.find_by_title_prefix("How") == (article_1,)
+
+        article_3 = Article(author, magazine, "How to be single and happy")
+        assert Article.find_by_title_prefix("How to") == (article_3, article_1)
+        assert Article.find_by_title_prefix("Why") == ()
+
+    def test_default_catalog_does_not_keep_articles_alive(self):
+        """an abandoned graph in the default catalog is collected"""
+        # A fresh interpreter, so no earlier test has looked up titles in the default catalog
+        script = """
+import gc, weakref
+from lib.classes import Article, Author, Magazine
+author = Author("Carry Bradshaw")
+magazine = Magazine("Vogue", "Fashion")
+Article(author, magazine, "How to wear a tutu with style")
+ref = weakref.ref(magazine)
+del author, magazine
+gc.collect()
+assert ref() is None
+"""
+        subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True)
+
+    def test_registry_is_built_on_first_use(self):
+        """the title registry picks up articles created before it was first used"""
+        with Catalog() as catalog:
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            article_1 = Article(author, magazine, "How to wear a tutu with style")
+            article_2 = Article(author, magazine, "How to be single and happy")
+            article_1.delete()
+            assert catalog._articles is None
+            assert Article.find_by_title_prefix("How") == (article_2,)
+            article_3 = Article(author, magazine, "How to date in NYC")
+            assert Article.find_by_title_prefix("How") == (article_2, article_3)
+
+    def test_move_to_another_catalog(self):
+        """an article moved to a magazine in another catalog is registered only there"""
+        with Catalog() as old:
+            author = Author("Carry Bradshaw")
+            article = Article(author, Magazine("Vogue", "Fashion"), "How to wear a tutu with style")
+            assert Article.find_by_title_prefix("How") == (article,)
+        with Catalog() as new:
+            magazine = Magazine("AD", "Architecture")
+            assert len(new.articles) == 0
+            article.magazine = magazine
+        assert old.articles.by_title_prefix("How") == ()
+        assert len(old.articles) == 0
+        assert new.articles.by_title_prefix("How") == (article,)
+
+        article.delete()
+        assert len(new.articles) == 0
+        assert article not in new.articles
+
+    def test_delete_many(self):
+        """deleted articles leave the title index and its count"""
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            articles = [Article(author, magazine, f"Article {i:03}") for i in range(100)]
+            for article in articles[:60]:
+                article.delete()
+            assert len(Article.all_articles) == 40
+            assert Article.find_by_title_prefix("Article 05") == ()
+            assert Article.find_by_title_prefix("Article 06") == tuple(articles[60:70])
+            assert list(Article.all_articles) == articles[60:]
+            assert articles[0] not in Article.all_articles
+            assert articles[99] in Article.all_articles
+
+    def test_find_by_title_prefix_after_inserts(self):
+        """prefix lookups interleaved with inserts see every article, sorted by title"""
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            articles = []
+            for i in reversed(range(600)):
+                articles.append(Article(author, magazine, f"Article {i:03}"))
+                assert Article.find_by_title_prefix(f"Article {i:03}") == (articles[-1],)
+            assert Article.find_by_title_prefix("Article 5") == tuple(reversed(articles[:100]))
+            twin = Article(author, magazine, "Article 599")
+            assert Article.find_by_title_prefix("Article 599") == (articles[0], twin)
+            assert len(Article.all_articles) == 601
+            assert list(Article.all_articles)[-2:] == [articles[0], twin]
+
+    def test_delete(self):
+        """delete unlinks the article from its author, magazine and registries"""
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            article = Article(author, magazine, "How to wear a tutu with style")
+            other = Article(author, magazine, "Dating life in NYC")
+            assert Magazine.top_publisher() is magazine
+
+            article.delete()
+            assert author.articles() == [other]
+            assert magazine.article_titles() == ("Dating life in NYC",)
+            assert magazine.contributor_count(author) == 1
+            assert article not in Article.all_articles
+            assert article.author is None
+
+            other.delete()
+            assert Magazine.top_publisher() is None
+            assert author.topic_areas() is None
+
+            try:
+                article.author = author
+                assert False, "Deleted article should not be relinked"
+            except AttributeError:
+                assert True
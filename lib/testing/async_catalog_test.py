@@ -0,0 +1,110 @@
+import asyncio
+
+from lib.classes.many_to_many import Author, Magazine, Article, Catalog, CatalogListener
+from lib.classes.async_catalog import AsyncCatalog
+
+
+class TestAsyncCatalog:
+    """Async facade in async_catalog.py"""
+
+    def test_concurrent_writes_are_batched(self, monkeypatch):
+        """concurrent add_article calls are committed in one batch"""
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+        batches = []
+        from_records = Article.from_records.__func__
+
+        def counting_from_records(cls, records):
+            batches.append(len(records))
+            return from_records(cls, records)
+
+        monkeypatch.setattr(Article, "from_records", classmethod(counting_from_records))
+
+        async def main():
+            catalog = AsyncCatalog()
+            return await asyncio.gather(
+                *(catalog.add_article(author, magazine, f"Article {i}") for i in range(20))
+            )
+
+        articles = asyncio.run(main())
+        assert batches == [20]
+        assert [article.title for article in articles] == [f"Article {i}" for i in range(20)]
+        assert magazine.articles() == articles
+
+    def test_invalid_write_fails_alone(self):
+        """an invalid write raises without failing the rest of its batch"""
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+
+        async def main():
+            catalog = AsyncCatalog()
+            return await asyncio.gather(
+                catalog.add_article(author, magazine, "Article 1"),
+                catalog.add_article(author, magazine, "Hi"),
+                catalog.add_article(author, magazine, "Article 3"),
+                return_exceptions=True,
+            )
+
+        first, second, third = asyncio.run(main())
+        assert isinstance(second, ValueError)
+        assert magazine.articles() == [first, third]
+
+    def test_failed_batch_fails_every_write(self):
+        """an unexpected error while committing reaches every waiting write"""
+
+        class Failing(CatalogListener):
+            def articles_added(self, articles):
+                raise RuntimeError("listener failed")
+
+        with Catalog() as tenant:
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            tenant.subscribe(Failing())
+
+            async def main():
+                catalog = AsyncCatalog()
+                writes = asyncio.gather(
+                    catalog.add_article(author, magazine, "Article 1"),
+                    catalog.add_article(author, magazine, "Hi"),
+                    catalog.add_article(author, magazine, "Article 3"),
+                    return_exceptions=True,
+                )
+                return await asyncio.wait_for(writes, timeout=5)
+
+            first, second, third = asyncio.run(main())
+        assert isinstance(first, RuntimeError)
+        assert isinstance(second, ValueError)
+        assert isinstance(third, RuntimeError)
+
+    def test_queries(self):
+        """query methods return the same results as the model"""
+        Magazine.all_magazines.clear()
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+
+        async def main():
+            catalog = AsyncCatalog()
+            for i in range(3):
+                await catalog.add_article(author, magazine, f"Article {i}")
+            return (
+                await catalog.contributors(magazine),
+                await catalog.topic_areas(author),
+                await catalog.contributing_authors(magazine),
+                await catalog.top_publisher(),
+                await catalog.top_publishers(1),
+            )
+
+        assert asyncio.run(main()) == ((author,), ("Fashion",), (author,), magazine, [magazine])
+
+    def test_queries_in_catalog(self):
+        """queries run in executor threads see the caller's catalog"""
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            author.add_article(magazine, "How to wear a tutu with style")
+
+            async def main():
+                catalog = AsyncCatalog()
+                return await catalog.top_publisher(), await catalog.top_publishers(2)
+
+            assert asyncio.run(main()) == (magazine, [magazine])
@@ -1,3 +1,5 @@
+import sys
+
 from lib.classes.many_to_many import Author, Magazine, Article
 
 
@@ -117,3 +119,73 @@ class TestAuthor:
         """topic_areas returns None if author has no articles"""
         author = Author("Carry Bradshaw")
         assert author.topic_areas() is None
+
+    def test_magazines_follow_new_articles(self):
+        """magazines and topic_areas reflect articles added after a call"""
+        author = Author("Carry Bradshaw")
+        magazine_1 = Magazine("Vogue", "Fashion")
+        magazine_2 = Magazine("AD", "Architecture")
+        Article(author, magazine_1, "How to wear a tutu with style")
+        assert author.magazines() == (magazine_1,)
+        assert author.topic_areas() == ("Fashion",)
+
+        Article(author, magazine_2, "Carrara Marble")
+        assert author.magazines() == (magazine_1, magazine_2)
+        assert author.topic_areas() == ("Fashion", "Architecture")
+
+    def test_topic_areas_follow_category_change(self):
+        """topic_areas reflects a magazine changing category"""
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+        Article(author, magazine, "How to wear a tutu with style")
+        assert author.topic_areas() == ("Fashion",)
+
+        magazine.category = "Lifestyle"
+        assert author.topic_areas() == ("Lifestyle",)
+
+    def test_derived_views_are_read_only(self):
+        """magazines and topic_areas cannot be mutated by callers"""
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+        Article(author, magazine, "How to wear a tutu with style")
+
+        assert author.magazines() is author.magazines()
+        try:
+            author.magazines().append(magazine)
+            assert False, "magazines should be read-only"
+        except AttributeError:
+            assert True
+
+    def test_articles_pages(self):
+        """articles can be read a page at a time or streamed"""
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+        articles = [Article(author, magazine, f"Article number {index}") for index in range(3)]
+
+        assert author.articles(limit=2) == articles[:2]
+        assert author.articles(limit=2, after=articles[1]) == articles[2:]
+        assert list(author.iter_articles(after=articles[0])) == articles[1:]
+        try:
+            author.articles(limit=-1)
+            assert False, "limit must not be negative"
+        except ValueError:
+            assert True
+
+    def test_page_cursors_hold_no_articles(self):
+        """serving a page does not keep its last article alive"""
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+        articles = [Article(author, magazine, f"Article number {index}") for index in range(3)]
+        before = sys.getrefcount(articles[1])
+        author.articles(limit=2)
+        after = sys.getrefcount(articles[1])
+        assert after == before
+        articles[1].delete()
+        assert author.articles(limit=2, after=articles[0]) == [articles[2]]
+
+    def test_find_by_name(self):
+        """find_by_name returns a registered author"""
+        author = Author("Unique Author Name")
+        assert Author.find_by_name("Unique Author Name") is author
+        assert author in Author.all_authors
+        assert Author.find_by_name("Nobody") is None
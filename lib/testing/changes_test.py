@@ -0,0 +1,127 @@
+import threading
+
+from lib.classes.changes import ChangeFeed, ChangesDropped
+from lib.classes.many_to_many import Author, Magazine, Article, Catalog, CatalogListener
+
+
+class TestChangeFeed:
+    """Change feed in changes.py"""
+
+    def test_records_changes_in_order(self):
+        """articles and magazine edits are numbered in order"""
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            feed = ChangeFeed()
+            article = Article(author, magazine, "How to wear a tutu with style")
+            magazine.name = "Vogue UK"
+            magazine.category = "Style"
+            article.delete()
+
+            changes = feed.read()
+            assert [change.sequence for change in changes] == [1, 2, 3, 4]
+            assert [change.kind for change in changes] == [
+                "article_added",
+                "magazine_renamed",
+                "magazine_recategorized",
+                "article_removed",
+            ]
+            assert changes[0].subject is article
+            assert changes[1].previous == "Vogue"
+            assert feed.read(after=2, limit=1) == [changes[2]]
+
+    def test_drops_oldest_when_full(self):
+        """a full buffer drops the oldest changes and lagging readers are told"""
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            feed = ChangeFeed(capacity=2)
+            Article.from_records([(author, magazine, f"Article number {index}") for index in range(3)])
+            assert [change.sequence for change in feed.read(after=1)] == [2, 3]
+            try:
+                feed.read(after=0)
+                assert False, "Dropped changes should raise exception"
+            except ChangesDropped:
+                assert True
+
+    def test_consumer_acknowledges(self):
+        """a consumer polls batches and frees what it acknowledged"""
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            feed = ChangeFeed(capacity=10)
+            consumer = feed.consumer()
+            Article.from_records([(author, magazine, f"Article number {index}") for index in range(3)])
+
+            assert [change.sequence for change in consumer.poll(limit=2)] == [1, 2]
+            assert [change.sequence for change in consumer.poll(limit=2)] == [3]
+            assert consumer.position == 2
+            consumer.commit()
+            assert feed.read(after=3) == []
+            try:
+                feed.read(after=0)
+                assert False, "Acknowledged changes should be freed"
+            except ChangesDropped:
+                assert True
+
+    def test_consumer_resyncs(self):
+        """a consumer that fell behind can skip to the oldest buffered change"""
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            feed = ChangeFeed(capacity=2)
+            consumer = feed.consumer()
+            Article.from_records([(author, magazine, f"Article number {index}") for index in range(3)])
+            try:
+                consumer.poll()
+                assert False, "A lagging consumer should be told changes were dropped"
+            except ChangesDropped as error:
+                consumer.seek(error.first - 1)
+            assert [change.sequence for change in consumer.poll()] == [2, 3]
+            consumer.seek(feed.last_sequence)
+            assert consumer.poll() == []
+
+    def test_blocks_writers(self):
+        """with overflow="block", writers wait for a consumer to catch up"""
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            feed = ChangeFeed(capacity=2, overflow="block", timeout=5)
+            consumer = feed.consumer()
+            seen = []
+
+            def consume():
+                while len(seen) < 5:
+                    seen.extend(change.sequence for change in consumer.poll(wait=5))
+
+            reader = threading.Thread(target=consume)
+            reader.start()
+            for index in range(5):
+                Article(author, magazine, f"Article number {index}")
+            reader.join(10)
+            assert seen == [1, 2, 3, 4, 5]
+
+    def test_block_needs_timeout(self):
+        """block mode refuses to let writers wait forever under the graph lock"""
+        with Catalog():
+            try:
+                ChangeFeed(overflow="block")
+                assert False, "Block mode without a timeout should raise exception"
+            except ValueError:
+                assert True
+
+    def test_removal_is_reported_before_unlinking(self):
+        """listeners see a deleted article still linked to its author and magazine"""
+        with Catalog() as catalog:
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            article = Article(author, magazine, "How to wear a tutu with style")
+            seen = []
+
+            class Recorder(CatalogListener):
+                def article_removed(self, removed):
+                    seen.append((removed.author, article in magazine.articles(), removed in Article.all_articles))
+
+            catalog.subscribe(Recorder())
+            article.delete()
+            assert seen == [(author, True, True)]
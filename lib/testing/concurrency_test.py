@@ -0,0 +1,102 @@
+import asyncio
+import sys
+import threading
+
+from lib.classes.many_to_many import Author, Catalog, Magazine, current_catalog
+
+
+class TestConcurrency:
+    """Concurrent writes to the graph in many_to_many.py"""
+
+    def test_concurrent_writes_and_reads(self):
+        """readers see consistent state while many threads add articles"""
+        Magazine.all_magazines.clear()
+        authors = [Author(f"Author {i}") for i in range(8)]
+        magazines = [Magazine(f"Magazine {i}", "Fashion") for i in range(5)]
+        writers = 8
+        per_writer = 500
+        errors = []
+        done = threading.Event()
+
+        def write(writer):
+            try:
+                for i in range(per_writer):
+                    author = authors[(writer + i) % len(authors)]
+                    author.add_article(magazines[i % len(magazines)], f"Article {writer}-{i}")
+            except Exception as error:
+                errors.append(error)
+
+        def read():
+            try:
+                while not done.is_set():
+                    top = Magazine.top_publisher()
+                    ranked = Magazine.top_publishers(3)
+                    if top is not None:
+                        assert ranked and top in magazines
+                    for magazine in magazines:
+                        contributors = magazine.contributors()
+                        assert len(set(contributors)) == len(contributors)
+                        assert set(contributors) <= set(authors)
+            except Exception as error:
+                errors.append(error)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            readers = [threading.Thread(target=read) for _ in range(4)]
+            threads = [threading.Thread(target=write, args=(n,)) for n in range(writers)]
+            for thread in readers + threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            done.set()
+            for thread in readers:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert errors == []
+        total = writers * per_writer
+        assert sum(len(magazine.articles()) for magazine in magazines) == total
+        assert sum(len(author.articles()) for author in authors) == total
+        for magazine in magazines:
+            assert sum(magazine.contributor_count(author) for author in authors) == len(magazine.articles())
+            assert set(magazine.contributors()) == {article.author for article in magazine.articles()}
+        top = Magazine.top_publisher()
+        assert len(top.articles()) == max(len(magazine.articles()) for magazine in magazines)
+        counts = [len(magazine.articles()) for magazine in Magazine.top_publishers(5)]
+        assert counts == sorted(counts, reverse=True)
+
+    def test_overlapping_catalog_blocks(self):
+        """tasks and threads can enter the same catalog without nesting"""
+        tenant = Catalog()
+        outside = current_catalog()
+
+        async def use(delay):
+            with tenant:
+                await asyncio.sleep(delay)
+                assert current_catalog() is tenant
+            assert current_catalog() is outside
+
+        async def main():
+            # The first task in is the first one out
+            await asyncio.gather(use(0.01), use(0.02))
+
+        asyncio.run(main())
+        errors = []
+        entered = threading.Barrier(4)
+
+        def enter():
+            try:
+                with tenant:
+                    entered.wait()
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=enter) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert current_catalog() is outside
@@ -1,4 +1,26 @@
 #!/usr/bin/env python3
+import pytest
+
+from lib.classes.many_to_many import Author, Magazine, Article, Catalog
+
+
+@pytest.fixture
+def synthetic_graph():
+    """Six authors, one of them without articles, and five magazines with 80
+    articles spread unevenly between them, in a catalog of their own"""
+    with Catalog():
+        authors = [Author(f"Author {i}") for i in range(6)]
+        magazines = [
+            Magazine("Vogue", "Fashion"),
+            Magazine("AD", "Architecture"),
+            Magazine("GQ", "Fashion"),
+            Magazine("Empty", "Nothing"),
+            Magazine("Wired", "Tech"),
+        ]
+        for i in range(80):
+            Article(authors[(i * 7) % 5], magazines[(i * i + i // 9) % 5 if i % 11 else 4], f"Article {i}")
+        yield authors, magazines
+
 
 def pytest_itemcollected(item):
     par = item.parent.obj
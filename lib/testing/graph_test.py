@@ -0,0 +1,64 @@
+from lib.classes.many_to_many import Author, Magazine, Article, Catalog
+from lib.classes.graph import AdjacencyIndex
+
+
+def build():
+    carry = Author("Carry Bradshaw")
+    nathaniel = Author("Nathaniel Holmes")
+    miranda = Author("Miranda Hobbes")
+    vogue = Magazine("Vogue", "Fashion")
+    ad = Magazine("AD", "Architecture")
+    law = Magazine("Law Weekly", "Law")
+    Article(carry, vogue, "How to wear a tutu with style")
+    Article(carry, ad, "Carrara Marble")
+    Article(nathaniel, vogue, "Dating life in NYC")
+    Article(nathaniel, ad, "Brownstones of Brooklyn")
+    Article(miranda, ad, "Open plan offices")
+    Article(miranda, law, "Partnership tracks")
+    return (carry, nathaniel, miranda), (vogue, ad, law)
+
+
+class TestAdjacencyIndex:
+    """Author and magazine adjacency in graph.py"""
+
+    def test_co_authors(self):
+        """co_authors counts the magazines shared with each other author"""
+        with Catalog():
+            (carry, nathaniel, miranda), (vogue, ad, _) = build()
+            index = AdjacencyIndex()
+            assert index.co_authors(carry) == [(nathaniel, 2), (miranda, 1)]
+            assert index.shared_magazines(carry, nathaniel) == (vogue, ad)
+            assert index.shared_magazines(carry, miranda) == (ad,)
+
+    def test_magazine_overlap(self):
+        """overlap counts the contributors two magazines share"""
+        with Catalog():
+            _, (vogue, ad, law) = build()
+            index = AdjacencyIndex()
+            assert index.overlap(vogue, ad) == 2
+            assert index.overlap(vogue, law) == 0
+            assert index.overlapping_magazines(ad) == [(vogue, 2), (law, 1)]
+
+    def test_reachable_categories(self):
+        """reachable_categories follows magazines through shared contributors"""
+        with Catalog():
+            (carry, _, miranda), (vogue, _, law) = build()
+            index = AdjacencyIndex()
+            assert index.reachable_categories(carry) == ("Fashion", "Architecture", "Law")
+            law.category = "Legal"
+            assert index.reachable_categories(miranda) == ("Architecture", "Legal", "Fashion")
+
+    def test_follows_changes(self):
+        """new, moved and deleted articles update the index"""
+        with Catalog():
+            (carry, nathaniel, miranda), (vogue, ad, law) = build()
+            index = AdjacencyIndex()
+            article = Article(carry, law, "Prenups explained")
+            assert index.overlap(vogue, law) == 1
+            article.author = nathaniel
+            assert index.co_authors(carry) == [(nathaniel, 2), (miranda, 1)]
+            assert index.overlap(vogue, law) == 1
+            article.magazine = ad
+            assert index.overlap(vogue, law) == 0
+            article.delete()
+            assert index.magazines(nathaniel) == ((vogue, 1), (ad, 1))
@@ -0,0 +1,44 @@
+import lib.classes
+from lib.benchmarks.import_time import measure
+from lib.classes import search
+
+# Generous, so a slow machine does not fail; the core import takes about 10 ms
+BUDGET_MICROSECONDS = 100_000
+OPTIONAL = ("asyncio", "sqlite3", "numpy", "concurrent.futures", "csv", "json", "mmap")
+
+
+class TestImportTime:
+    """Startup cost of the lib package"""
+
+    def test_core_import_is_cheap(self):
+        """importing lib.classes stays within budget and loads no optional subsystem"""
+        micros, loaded = measure("lib.classes", repeat=3)
+        assert micros < BUDGET_MICROSECONDS
+        for module in OPTIONAL:
+            assert module not in loaded
+        for name in lib.classes._SUBMODULES:
+            assert f"lib.classes.{name}" not in loaded
+
+    def test_debug_does_not_need_ipdb(self):
+        """the debug script only imports ipdb when it starts the debugger"""
+        _, loaded = measure("lib.debug", repeat=1)
+        assert "ipdb" not in loaded
+        assert "cProfile" not in loaded
+
+
+class TestLazyAttributes:
+    """Optional subsystems resolved through lib.classes"""
+
+    def test_resolves_on_access(self):
+        """names and submodules load on first use"""
+        assert lib.classes.TitleIndex is search.TitleIndex
+        assert lib.classes.search is search
+        assert "VectorEngine" in dir(lib.classes)
+
+    def test_unknown_name(self):
+        """unknown names raise AttributeError"""
+        try:
+            lib.classes.NotAThing
+            assert False
+        except AttributeError:
+            assert True
@@ -0,0 +1,71 @@
+import pytest
+
+from lib.classes import instrumentation
+from lib.classes.many_to_many import Author, Magazine, Article, Catalog
+
+
+@pytest.fixture
+def recording():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    """Opt-in call statistics in instrumentation.py"""
+
+    def test_disabled_by_default(self):
+        """the model's own methods are in place unless enabled"""
+        original = Author.magazines
+        instrumentation.enable()
+        assert Author.magazines is not original
+        instrumentation.disable()
+        assert Author.magazines is original
+        assert not instrumentation.enabled()
+
+    def test_counts_calls_and_results(self, recording):
+        """calls, result sizes and constructions are recorded"""
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            author.add_article(magazine, "How to wear a tutu with style")
+            Article.from_records([(author, magazine, "Dating life in NYC")])
+            author.magazines()
+            magazine.contributors()
+
+        stats = instrumentation.snapshot()
+        assert stats["methods"]["Author.magazines"]["calls"] == 1
+        assert stats["methods"]["Author.magazines"]["items"] == 1
+        assert stats["methods"]["Author.add_article"]["calls"] == 1
+        assert stats["constructions"] == {"Author": 1, "Magazine": 1, "Article": 2}
+        assert sum(calls for _, calls in stats["methods"]["Magazine.contributors"]["buckets"]) == 1
+
+    def test_counts_validation_failures(self, recording):
+        """rejected values are counted once per class"""
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            magazine = Magazine("Vogue", "Fashion")
+            for attempt in (lambda: Author(""), lambda: author.add_article(magazine, "x"),
+                            lambda: setattr(magazine, "name", "x")):
+                try:
+                    attempt()
+                    assert False, "Invalid values should raise exception"
+                except ValueError:
+                    assert True
+
+        stats = instrumentation.snapshot()
+        assert stats["validation_failures"] == {"Author": 1, "Article": 1, "Magazine": 1}
+        assert stats["methods"]["Author.add_article"]["errors"] == 1
+
+    def test_prometheus(self, recording):
+        """prometheus renders counters and cumulative histograms"""
+        with Catalog():
+            Magazine("Vogue", "Fashion")
+            Magazine.top_publisher()
+        text = instrumentation.prometheus()
+        assert '# TYPE m2m_method_duration_seconds histogram' in text
+        assert 'm2m_method_calls_total{method="Magazine.top_publisher"} 1' in text
+        assert 'm2m_method_duration_seconds_bucket{method="Magazine.top_publisher",le="+Inf"} 1' in text
+        assert 'm2m_constructions_total{class="Magazine"} 1' in text
@@ -1,4 +1,4 @@
-from lib.classes.many_to_many import Author, Magazine, Article
+from lib.classes.many_to_many import Author, Magazine, Article, Catalog
 
 
 class TestMagazine:
@@ -186,3 +186,270 @@ class TestMagazine:
         """top_publisher returns None if no articles"""
         Magazine.all_magazines.clear()
         assert Magazine.top_publisher() is None
+
+    def test_top_publisher_follows_new_articles(self):
+        """top_publisher updates as articles are added"""
+        Magazine.all_magazines.clear()
+        magazine_1 = Magazine("Vogue", "Fashion")
+        magazine_2 = Magazine("AD", "Architecture")
+        author = Author("Carry Bradshaw")
+
+        Article(author, magazine_1, "Article 1")
+        assert Magazine.top_publisher() == magazine_1
+
+        Article(author, magazine_2, "Article 2")
+        Article(author, magazine_2, "Article 3")
+        assert Magazine.top_publisher() == magazine_2
+
+    def test_top_publishers(self):
+        """top_publishers returns the top k magazines in order"""
+        Magazine.all_magazines.clear()
+        magazine_1 = Magazine("Vogue", "Fashion")
+        magazine_2 = Magazine("AD", "Architecture")
+        magazine_3 = Magazine("GQ", "Fashion")
+        Magazine("Empty", "Nothing")
+        author = Author("Carry Bradshaw")
+
+        Article(author, magazine_2, "Article 1")
+        Article(author, magazine_1, "Article 2")
+        Article(author, magazine_1, "Article 3")
+        Article(author, magazine_3, "Article 4")
+        Article(author, magazine_3, "Article 5")
+        Article(author, magazine_3, "Article 6")
+
+        assert Magazine.top_publishers(2) == [magazine_3, magazine_1]
+        assert Magazine.top_publishers(10) == [magazine_3, magazine_1, magazine_2]
+        assert Magazine.top_publishers(0) == []
+
+    def test_contributing_authors_min_articles(self):
+        """contributing_authors accepts a minimum article count"""
+        author_1 = Author("Carry Bradshaw")
+        author_2 = Author("Nathaniel Holmes")
+        magazine = Magazine("Vogue", "Fashion")
+        Article(author_1, magazine, "Article 1")
+        Article(author_1, magazine, "Article 2")
+        Article(author_2, magazine, "Article 3")
+
+        assert magazine.contributing_authors(min_articles=2) == (author_1,)
+        assert magazine.contributing_authors(min_articles=1) == (author_1, author_2)
+        assert magazine.contributing_authors() is None
+
+        Article(author_1, magazine, "Article 4")
+        assert magazine.contributing_authors() == (author_1,)
+
+    def test_contributor_count(self):
+        """contributor_count returns the author's article count for the magazine"""
+        author_1 = Author("Carry Bradshaw")
+        author_2 = Author("Nathaniel Holmes")
+        magazine = Magazine("Vogue", "Fashion")
+        article = Article(author_1, magazine, "Article 1")
+        Article(author_1, magazine, "Article 2")
+
+        assert magazine.contributor_count(author_1) == 2
+        assert magazine.contributor_count(author_2) == 0
+
+        article.author = author_2
+        assert magazine.contributor_count(author_1) == 1
+        assert magazine.contributor_count(author_2) == 1
+
+    def test_find_by_name(self):
+        """find_by_name follows name changes"""
+        Magazine.all_magazines.clear()
+        magazine = Magazine("Vogue", "Fashion")
+        assert Magazine.find_by_name("Vogue") is magazine
+
+        magazine.name = "New Vogue"
+        assert Magazine.find_by_name("Vogue") is None
+        assert Magazine.find_by_name("New Vogue") is magazine
+
+    def test_find_by_category(self):
+        """find_by_category follows category changes"""
+        Magazine.all_magazines.clear()
+        magazine_1 = Magazine("Vogue", "Fashion")
+        magazine_2 = Magazine("GQ", "Fashion")
+        magazine_3 = Magazine("AD", "Architecture")
+        assert Magazine.find_by_category("Fashion") == (magazine_1, magazine_2)
+
+        magazine_2.category = "Lifestyle"
+        assert Magazine.find_by_category("Fashion") == (magazine_1,)
+        assert Magazine.find_by_category("Lifestyle") == (magazine_2,)
+        assert Magazine.find_by_category("Architecture") == (magazine_3,)
+        assert Magazine.find_by_category("Cooking") == ()
+
+    def test_registry_does_not_keep_magazines_alive(self):
+        """magazines that are no longer referenced leave the registry"""
+        import gc
+
+        with Catalog():
+            Magazine("Vogue", "Fashion")
+            kept = Magazine("AD", "Architecture")
+            gc.collect()
+            assert list(Magazine.all_magazines) == [kept]
+            assert Magazine.find_by_name("Vogue") is None
+            assert Magazine.find_by_category("Fashion") == ()
+
+    def test_catalogs_are_isolated(self):
+        """magazines created in a catalog are registered only there"""
+        outer = Magazine("Vogue", "Fashion")
+        with Catalog() as catalog:
+            inner = Magazine("AD", "Architecture")
+            assert Magazine.all_magazines is catalog.magazines
+            assert list(Magazine.all_magazines) == [inner]
+        assert inner not in Magazine.all_magazines
+        assert outer in Magazine.all_magazines
+
+    def test_articles_pages(self):
+        """articles returns one page at a time after a cursor article"""
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+        articles = [Article(author, magazine, f"Article number {index}") for index in range(5)]
+
+        first = magazine.articles(limit=2)
+        assert first == articles[:2]
+        second = magazine.articles(limit=2, after=first[-1])
+        assert second == articles[2:4]
+        assert magazine.articles(limit=2, after=second[-1]) == articles[4:]
+        assert magazine.articles(limit=2, after=articles[-1]) == []
+        assert magazine.articles(after=articles[0]) == articles[1:]
+
+    def test_articles_pages_survive_removal(self):
+        """a cursor stays valid when an earlier article is removed"""
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+        articles = [Article(author, magazine, f"Article number {index}") for index in range(4)]
+
+        page = magazine.articles(limit=2)
+        articles[0].delete()
+        assert magazine.articles(limit=2, after=page[-1]) == articles[2:]
+        try:
+            magazine.articles(limit=2, after=articles[0])
+            assert False, "a deleted article is not a valid cursor"
+        except ValueError:
+            assert True
+
+    def test_iter_article_titles(self):
+        """iter_article_titles streams titles and ignores articles added meanwhile"""
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+        first = Article(author, magazine, "How to wear a tutu with style")
+        Article(author, magazine, "Dating life in NYC")
+
+        titles = magazine.iter_article_titles()
+        assert next(titles) == "How to wear a tutu with style"
+        Article(author, magazine, "Added while streaming")
+        assert list(titles) == ["Dating life in NYC"]
+        assert list(magazine.iter_article_titles(after=first)) == [
+            "Dating life in NYC",
+            "Added while streaming",
+        ]
+
+    def test_top_publisher_ties(self, monkeypatch):
+        """ties go to the magazine registered first"""
+        from lib.classes import many_to_many
+
+        monkeypatch.setattr(many_to_many, "_clock", lambda: 1_000_000.0)
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            vogue = Magazine("Vogue", "Fashion")
+            elle = Magazine("Elle", "Beauty")
+            Article(author, elle, "Dating life in NYC")
+            Article(author, vogue, "How to wear a tutu with style")
+            assert Magazine.top_publisher() is vogue
+            assert Magazine.top_publishers(2) == [vogue, elle]
+            assert Magazine.top_publisher(window=60) is vogue
+
+            elle.category = "Fashion"
+            vogue.category = "Style"
+            vogue.category = "Fashion"
+            assert Magazine.top_publisher(category="Fashion") is vogue
+
+    def test_top_publisher_in_category(self):
+        """top_publisher ranks only the magazines in a category"""
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            vogue = Magazine("Vogue", "Fashion")
+            elle = Magazine("Elle", "Fashion")
+            ad = Magazine("AD", "Architecture")
+            Article(author, ad, "Carrara Marble")
+            Article(author, ad, "Brownstones of Brooklyn")
+            Article(author, elle, "Dating life in NYC")
+            assert Magazine.top_publisher() is ad
+            assert Magazine.top_publisher(category="Fashion") is elle
+            Article(author, vogue, "How to wear a tutu with style")
+            Article(author, vogue, "How to be single and happy")
+            assert Magazine.top_publisher(category="Fashion") is vogue
+            assert Magazine.top_publisher(category="Food") is None
+
+    def test_trending_retention_without_queries(self, monkeypatch):
+        """expired trending buckets are dropped by writes alone"""
+        from lib.classes import many_to_many
+
+        now = [1_000_000.0]
+        monkeypatch.setattr(many_to_many, "_clock", lambda: now[0])
+        with Catalog() as catalog:
+            author = Author("Carry Bradshaw")
+            vogue = Magazine("Vogue", "Fashion")
+            counter = catalog.trending
+            for minute in range(2000):
+                now[0] += 60
+                Article(author, vogue, f"Article {minute}")
+            assert len(counter._buckets) <= 1440
+            assert len(counter._numbers) == len(counter._buckets)
+            assert Magazine.top_publisher(window=3600) is vogue
+
+    def test_trending_tracks_few_windows(self, monkeypatch):
+        """only the most recently queried windows keep running totals"""
+        from lib.classes import many_to_many
+
+        now = [1_000_000.0]
+        monkeypatch.setattr(many_to_many, "_clock", lambda: now[0])
+        with Catalog() as catalog:
+            author = Author("Carry Bradshaw")
+            vogue = Magazine("Vogue", "Fashion")
+            elle = Magazine("Elle", "Fashion")
+            Article(author, vogue, "How to wear a tutu with style")
+            now[0] += 600
+            Article(author, elle, "Dating life in NYC")
+            Article(author, elle, "How to be single and happy")
+            for minutes in range(1, 40):
+                assert Magazine.top_publisher(window=minutes * 60) is elle
+            assert len(catalog.trending._windows) == many_to_many._TRACKED_WINDOWS
+            Article(author, vogue, "Carrara Marble")
+            Article(author, vogue, "Brownstones of Brooklyn")
+            Article(author, vogue, "Sex and the City")
+            assert Magazine.top_publisher(window=39 * 60) is vogue  # tracked
+            assert Magazine.top_publisher(window=60) is vogue  # summed again
+
+    def test_top_publisher_in_window(self, monkeypatch):
+        """top_publisher with a window counts only recent articles"""
+        from lib.classes import many_to_many
+
+        now = [1_000_000.0]
+        monkeypatch.setattr(many_to_many, "_clock", lambda: now[0])
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            vogue = Magazine("Vogue", "Fashion")
+            elle = Magazine("Elle", "Fashion")
+            ad = Magazine("AD", "Architecture")
+            Article(author, vogue, "How to wear a tutu with style")
+            Article(author, vogue, "How to be single and happy")
+            assert Magazine.top_publisher(window=3600) is vogue
+
+            now[0] += 7200
+            assert Magazine.top_publisher(window=3600) is None
+            article = Article(author, elle, "Dating life in NYC")
+            Article(author, ad, "Carrara Marble")
+            Article(author, ad, "Brownstones of Brooklyn")
+            assert Magazine.top_publisher(window=3600) is ad
+            assert Magazine.top_publisher(window=3600, category="Fashion") is elle
+            assert Magazine.top_publisher(window=86400) is vogue
+            assert article.created_at == now[0]
+
+            now[0] += 3600
+            article.delete()
+            assert Magazine.top_publisher(window=7200, category="Fashion") is None
+            try:
+                Magazine.top_publisher(window=7 * 86400)
+                assert False, "windows are limited to the retained history"
+            except ValueError:
+                assert True
@@ -0,0 +1,115 @@
+from lib.classes.many_to_many import Author, Magazine, Article, Catalog
+from lib.classes.search import TitleIndex
+
+
+def build():
+    author_1 = Author("Carry Bradshaw")
+    author_2 = Author("Nathaniel Holmes")
+    vogue = Magazine("Vogue", "Fashion")
+    ad = Magazine("AD", "Architecture")
+    articles = [
+        Article(author_1, vogue, "How to wear a tutu with style"),
+        Article(author_2, vogue, "Dating life in NYC"),
+        Article(author_1, ad, "Style in Carrara Marble"),
+        Article(author_1, vogue, "Wear style, not a tutu"),
+    ]
+    return (author_1, author_2), (vogue, ad), articles
+
+
+class TestTitleIndex:
+    """Inverted title index in search.py"""
+
+    def test_word_queries(self):
+        """search returns articles containing every word, case-insensitively"""
+        with Catalog():
+            _, _, articles = build()
+            index = TitleIndex()
+            assert set(index.search("STYLE")) == {articles[0], articles[2], articles[3]}
+            assert set(index.search("tutu style")) == {articles[0], articles[3]}
+            assert index.search("tutu marble") == []
+            assert len(index.search("style", limit=2)) == 2
+
+    def test_prefix_and_phrase_queries(self):
+        """search_prefix completes the last word and search_phrase keeps word order"""
+        with Catalog():
+            _, _, articles = build()
+            index = TitleIndex()
+            assert set(index.search_prefix("car")) == {articles[2]}
+            assert set(index.search_prefix("wear tu")) == {articles[0], articles[3]}
+            assert index.search_phrase("wear a tutu") == [articles[0]]
+
+    def test_follows_catalog(self):
+        """the index picks up new articles and drops deleted ones"""
+        with Catalog():
+            (author, _), (vogue, _), articles = build()
+            index = TitleIndex()
+            added = Article(author, vogue, "A tutu for every season")
+            records = Article.from_records([(author, vogue, "The tutu returns")])
+            articles[0].delete()
+            assert set(index.search("tutu")) == {articles[3], added, records[0]}
+            assert len(index) == 5
+            index.close()
+            Article(author, vogue, "Tutu fatigue sets in")
+            assert len(index.search("tutu")) == 3
+
+    def test_drops_titles_without_words(self):
+        """articles whose titles have no words are dropped from the count too"""
+        with Catalog():
+            (author, _), (vogue, _), articles = build()
+            index = TitleIndex()
+            shouting = Article(author, vogue, "!!!!!")
+            assert len(index) == 5
+            shouting.delete()
+            articles[1].magazine = Magazine("Elle", "Fashion")
+            assert len(index) == 4
+            assert index.search("dating") == [articles[1]]
+            assert shouting not in index.articles()
+
+    def test_moves_do_not_grow_the_index(self):
+        """reassigning an article many times keeps the index small"""
+        with Catalog():
+            authors, magazines, articles = build()
+            index = TitleIndex()
+            moved = articles[1]
+            for i in range(10_000):
+                moved.author = authors[i % 2]
+            assert len(index) == 4
+            assert len(index._articles) <= 4 + 65
+            assert len(index._postings["dating"]) <= 1 + 65
+            assert index.search("dating nyc") == [moved]
+            assert set(index.search_prefix("sty")) == {articles[0], articles[2], articles[3]}
+            assert index.search_phrase("wear a tutu") == [articles[0]]
+
+    def test_rank(self):
+        """rank counts search results per magazine or author"""
+        with Catalog():
+            (author_1, _), (vogue, ad), _ = build()
+            index = TitleIndex()
+            results = index.search("style")
+            assert TitleIndex.rank(results) == [(vogue, 2), (ad, 1)]
+            assert TitleIndex.rank(results, by="author") == [(author_1, 3)]
+            try:
+                TitleIndex.rank(results, by="category")
+                assert False, "only magazines and authors can be ranked"
+            except ValueError:
+                assert True
+
+    def test_save_and_load(self, tmp_path):
+        """a saved index answers the same queries once loaded"""
+        with Catalog() as catalog:
+            (author, _), (vogue, _), articles = build()
+            index = TitleIndex()
+            articles[1].delete()
+            path = tmp_path / "titles.idx"
+            index.save(path)
+
+            loaded = TitleIndex.load(path, index.articles(), catalog)
+            assert set(loaded.search("style")) == set(index.search("style"))
+            assert loaded.search_phrase("dating life") == []
+            added = Article(author, vogue, "Style after sixty")
+            assert added in loaded.search("style")
+            try:
+                TitleIndex.load(path, [])
+                assert False, "the article count must match"
+            except ValueError:
+                assert True
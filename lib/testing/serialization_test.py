@@ -0,0 +1,81 @@
+import pytest
+
+from lib.classes.many_to_many import Author, Magazine, Article, BulkValidationError
+from lib.classes.serialization import export, load, read_records
+
+
+class TestSerialization:
+    """Streaming import and export in serialization.py"""
+
+    @pytest.mark.parametrize("suffix", ["csv", "jsonl"])
+    def test_round_trip(self, tmp_path, suffix):
+        """export then load recreates the graph"""
+        author_1 = Author("Carry Bradshaw")
+        author_2 = Author("Nathaniel Holmes")
+        magazine_1 = Magazine("Vogue", "Fashion")
+        magazine_2 = Magazine("AD", "Architecture")
+        articles = [
+            Article(author_1, magazine_1, "How to wear a tutu with style"),
+            Article(author_2, magazine_1, "Dating life in NYC"),
+            Article(author_1, magazine_2, "Carrara Marble"),
+        ]
+
+        path = tmp_path / f"articles.{suffix}"
+        assert export(articles, path) == 3
+
+        authors, magazines = load(path)
+        assert sorted(authors) == ["Carry Bradshaw", "Nathaniel Holmes"]
+        assert sorted(magazines) == ["AD", "Vogue"]
+        assert magazines["Vogue"].category == "Fashion"
+        assert magazines["Vogue"].article_titles() == (
+            "How to wear a tutu with style",
+            "Dating life in NYC",
+        )
+        assert authors["Carry Bradshaw"].topic_areas() == ("Fashion", "Architecture")
+
+    def test_read_records_streams(self, tmp_path):
+        """read_records yields one dict per line"""
+        path = tmp_path / "articles.jsonl"
+        path.write_text(
+            '{"author": "Carry Bradshaw", "magazine": "Vogue", "category": "Fashion", "title": "Article 1"}\n'
+            "\n"
+            '{"author": "Carry Bradshaw", "magazine": "Vogue", "category": "Fashion", "title": "Article 2"}\n'
+        )
+        records = read_records(path)
+        assert next(records)["title"] == "Article 1"
+        assert next(records)["title"] == "Article 2"
+
+    def test_load_reports_invalid_rows(self, tmp_path):
+        """load reports invalid titles by row across batches"""
+        path = tmp_path / "articles.csv"
+        path.write_text(
+            "author,magazine,category,title\n"
+            "Carry Bradshaw,Vogue,Fashion,Article 1\n"
+            "Carry Bradshaw,Vogue,Fashion,Hi\n"
+            "Carry Bradshaw,Vogue,Fashion,Article 3\n"
+            "Carry Bradshaw,Vogue,Fashion,No\n"
+        )
+        try:
+            load(path, batch_size=2)
+            assert False, "Invalid rows should raise exception"
+        except BulkValidationError as error:
+            assert [index for index, _ in error.errors] == [1]
+
+        try:
+            load(path, batch_size=10)
+            assert False, "Invalid rows should raise exception"
+        except BulkValidationError as error:
+            assert [index for index, _ in error.errors] == [1, 3]
+
+    def test_load_reports_malformed_records(self, tmp_path):
+        """records missing a field or not holding an object are reported by row"""
+        path = tmp_path / "articles.jsonl"
+        valid = '{"author": "Carry Bradshaw", "magazine": "Vogue", "category": "Fashion", "title": "Article 1"}'
+        untitled = '{"author": "Carry Bradshaw", "magazine": "Vogue", "category": "Fashion"}'
+        for line in (untitled, '["Carry Bradshaw"]'):
+            path.write_text(f"{valid}\n{line}\n")
+            try:
+                load(path)
+                assert False, "Malformed records should raise exception"
+            except ValueError as error:
+                assert str(error).startswith("Invalid record at row 1")
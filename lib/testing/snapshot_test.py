@@ -0,0 +1,91 @@
+import pytest
+
+from lib.classes.many_to_many import Author, Magazine, Article
+from lib.classes.snapshot import Snapshot, save
+
+
+@pytest.fixture
+def graph():
+    author_1 = Author("Carry Bradshaw")
+    author_2 = Author("Nathaniel Holmes")
+    magazine_1 = Magazine("Vogue", "Fashion")
+    magazine_2 = Magazine("AD", "Architecture")
+    Article(author_1, magazine_1, "How to wear a tutu with style")
+    Article(author_2, magazine_1, "Dating life in NYC")
+    Article(author_1, magazine_2, "Carrara Marble")
+    Article(author_1, magazine_1, "How to be single and happy")
+    return [author_1, author_2], [magazine_1, magazine_2]
+
+
+class TestSnapshot:
+    """Memory-mapped snapshots in snapshot.py"""
+
+    def test_lazy_reads(self, tmp_path, graph):
+        """snapshot views answer relationship queries"""
+        authors, magazines = graph
+        path = tmp_path / "graph.snap"
+        save(path, authors, magazines)
+
+        with Snapshot(path) as snapshot:
+            assert snapshot.author_count == 2
+            assert snapshot.magazine_count == 2
+            assert snapshot.article_count == 4
+
+            carry = snapshot.author(0)
+            assert carry.name == "Carry Bradshaw"
+            assert [article.title for article in carry.articles()] == [
+                "How to wear a tutu with style",
+                "Carrara Marble",
+                "How to be single and happy",
+            ]
+            assert [magazine.name for magazine in carry.magazines()] == ["Vogue", "AD"]
+            assert carry.topic_areas() == ["Fashion", "Architecture"]
+
+            vogue = snapshot.magazine(0)
+            assert vogue.category == "Fashion"
+            assert vogue.article_titles() == [
+                "How to wear a tutu with style",
+                "Dating life in NYC",
+                "How to be single and happy",
+            ]
+            assert [author.name for author in vogue.contributors()] == [
+                "Carry Bradshaw",
+                "Nathaniel Holmes",
+            ]
+            assert vogue.articles()[1].author == snapshot.author(1)
+
+    def test_materialize(self, tmp_path, graph):
+        """materialize rebuilds live instances"""
+        path = tmp_path / "graph.snap"
+        save(path, *graph)
+
+        with Snapshot(path) as snapshot:
+            authors, magazines = snapshot.materialize()
+
+        assert [author.name for author in authors] == ["Carry Bradshaw", "Nathaniel Holmes"]
+        assert magazines[0].article_titles() == (
+            "How to wear a tutu with style",
+            "Dating life in NYC",
+            "How to be single and happy",
+        )
+        assert magazines[0].contributor_count(authors[0]) == 2
+        assert authors[1].magazines() == (magazines[0],)
+
+    def test_rejects_other_files(self, tmp_path):
+        """Snapshot rejects files that are not snapshots"""
+        path = tmp_path / "graph.snap"
+        path.write_bytes(b"\0" * 512)
+        try:
+            Snapshot(path)
+            assert False, "Files that are not snapshots should raise exception"
+        except ValueError:
+            assert True
+
+    def test_requires_every_magazine(self, tmp_path, graph):
+        """save refuses articles whose magazine is not being saved"""
+        authors, magazines = graph
+        try:
+            save(tmp_path / "graph.snap", authors, magazines[:1])
+            assert False, "Articles in magazines not being saved should raise exception"
+        except ValueError:
+            assert True
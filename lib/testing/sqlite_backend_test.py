@@ -0,0 +1,134 @@
+import pytest
+
+from lib.classes.many_to_many import Author, Magazine, Article
+from lib.classes.sqlite_backend import SQLiteCatalog
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    with SQLiteCatalog(tmp_path / "articles.db") as catalog:
+        yield catalog
+
+
+class TestSQLiteCatalog:
+    """SQLite storage in sqlite_backend.py"""
+
+    def test_relationships(self, catalog):
+        """stored records answer the same queries as the model"""
+        carry = catalog.add_author("Carry Bradshaw")
+        nathaniel = catalog.add_author("Nathaniel Holmes")
+        vogue = catalog.add_magazine("Vogue", "Fashion")
+        ad = catalog.add_magazine("AD", "Architecture")
+        for i in range(3):
+            catalog.add_article(carry, vogue, f"Article {i}")
+        catalog.add_article(nathaniel, vogue, "Dating life in NYC")
+        catalog.add_article(carry, ad, "Carrara Marble")
+
+        assert [article.title for article in carry.articles()] == [
+            "Article 0",
+            "Article 1",
+            "Article 2",
+            "Carrara Marble",
+        ]
+        assert carry.magazines() == [vogue, ad]
+        assert carry.topic_areas() == ["Fashion", "Architecture"]
+        assert vogue.contributors() == [carry, nathaniel]
+        assert vogue.contributing_authors() == [carry]
+        assert ad.contributing_authors() is None
+        assert vogue.contributor_count(carry) == 3
+        assert vogue.article_titles()[-1] == "Dating life in NYC"
+        assert catalog.top_publisher() == vogue
+        assert catalog.top_publishers(5) == [vogue, ad]
+        assert vogue.articles()[0].author == carry
+
+    def test_validation(self, catalog):
+        """writes are validated like the model"""
+        author = catalog.add_author("Carry Bradshaw")
+        magazine = catalog.add_magazine("Vogue", "Fashion")
+        for write in (
+            lambda: catalog.add_author(""),
+            lambda: catalog.add_magazine("A", "Fashion"),
+            lambda: catalog.add_article(author, magazine, "Hi"),
+        ):
+            try:
+                write()
+                assert False, "Invalid values should raise exception"
+            except ValueError:
+                assert True
+        assert magazine.articles() == []
+
+    def test_record_fields(self, catalog):
+        """magazine edits are validated and stored; names and titles are read-only"""
+        author = catalog.add_author("Carry Bradshaw")
+        magazine = catalog.add_magazine("Vogue", "Fashion")
+        article = catalog.add_article(author, magazine, "Dating life in NYC")
+        magazine.name = "Vogue UK"
+        magazine.category = "Style"
+        assert (magazine.name, magazine.category) == ("Vogue UK", "Style")
+        stored = catalog.magazine(magazine.id)
+        assert (stored.name, stored.category) == ("Vogue UK", "Style")
+
+        for record, field, value in ((magazine, "name", "A"), (magazine, "category", "")):
+            try:
+                setattr(record, field, value)
+                assert False, "Invalid values should raise exception"
+            except ValueError:
+                assert True
+        for record, field in ((author, "name"), (article, "title")):
+            try:
+                setattr(record, field, "Something else")
+                assert False, "Read-only fields should raise exception"
+            except AttributeError:
+                assert True
+        assert catalog.magazine(magazine.id).name == "Vogue UK"
+
+    def test_save_and_reopen(self, tmp_path):
+        """saved graphs survive reopening the database"""
+        author = Author("Carry Bradshaw")
+        magazine = Magazine("Vogue", "Fashion")
+        Article(author, magazine, "How to wear a tutu with style")
+        Article(author, magazine, "Dating life in NYC")
+
+        path = tmp_path / "articles.db"
+        with SQLiteCatalog(path) as catalog:
+            stored = catalog.save([author], [magazine])
+            assert stored[magazine].article_titles() == list(magazine.article_titles())
+
+        with SQLiteCatalog(path) as catalog:
+            (stored_author,) = catalog.authors()
+            assert stored_author.name == "Carry Bradshaw"
+            assert stored_author.topic_areas() == ["Fashion"]
+            assert catalog.top_publisher().name == "Vogue"
+
+    def test_close(self, tmp_path):
+        """a closed catalog closes borrowed connections and refuses new queries"""
+        import sqlite3
+        import threading
+
+        catalog = SQLiteCatalog(tmp_path / "articles.db", pool_size=1)
+        author = catalog.add_author("Carry Bradshaw")
+        errors = []
+
+        def query():
+            try:
+                author.articles()
+            except ValueError as error:
+                errors.append(error)
+
+        with catalog._pool.connection() as borrowed:
+            waiter = threading.Thread(target=query)  # waits for the only connection
+            waiter.start()
+            catalog.close()
+            waiter.join(timeout=5)
+            assert not waiter.is_alive()
+        assert len(errors) == 1
+        try:
+            borrowed.execute("SELECT 1")
+            assert False, "Connections returned after close should be closed"
+        except sqlite3.ProgrammingError:
+            assert True
+        try:
+            author.articles()
+            assert False, "Queries on a closed catalog should raise exception"
+        except ValueError:
+            assert True
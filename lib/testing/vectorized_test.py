@@ -0,0 +1,71 @@
+import pytest
+
+from lib.classes.many_to_many import Author, Magazine, Article, Catalog
+
+np = pytest.importorskip("numpy")
+
+from lib.classes.vectorized import VectorEngine  # noqa: E402
+
+
+class TestVectorEngine:
+    """NumPy aggregation engine in vectorized.py"""
+
+    def test_matches_object_api(self, synthetic_graph):
+        """engine results match the object API exactly"""
+        authors, magazines = synthetic_graph
+        engine = VectorEngine(authors, magazines)
+
+        counts = engine.article_counts()
+        assert [int(count) for count in counts] == [len(magazine.articles()) for magazine in magazines]
+
+        contributing = engine.contributing_authors()
+        for magazine in magazines:
+            assert contributing[magazine] == magazine.contributing_authors()
+        contributing = engine.contributing_authors(min_articles=1)
+        for magazine in magazines:
+            assert contributing[magazine] == magazine.contributing_authors(min_articles=1)
+
+        contributor_counts = engine.contributor_counts()
+        for magazine in magazines:
+            assert list(contributor_counts[magazine]) == list(magazine.contributors())
+            for author in authors:
+                assert contributor_counts[magazine].get(author, 0) == magazine.contributor_count(author)
+
+        topic_areas = engine.topic_areas()
+        for author in authors:
+            assert topic_areas[author] == author.topic_areas()
+
+    def test_top_publishers(self):
+        """top_publishers matches Magazine.top_publishers, ties included"""
+        with Catalog():
+            author = Author("Carry Bradshaw")
+            vogue = Magazine("Vogue", "Fashion")
+            elle = Magazine("Elle", "Fashion")
+            ad = Magazine("AD", "Architecture")
+            Magazine("Empty", "Nothing")
+            Article(author, elle, "Dating life in NYC")
+            Article(author, vogue, "How to wear a tutu with style")
+            Article(author, ad, "Carrara Marble")
+            Article(author, ad, "Brownstones of Brooklyn")
+            magazines = list(reversed(list(Magazine.all_magazines)))
+            engine = VectorEngine([author], magazines)
+            assert engine.top_publishers() == Magazine.top_publishers(10) == [ad, vogue, elle]
+            assert engine.top_publishers(2) == Magazine.top_publishers(2)
+            assert engine.top_publisher() is Magazine.top_publisher()
+
+    def test_category_histograms(self, synthetic_graph):
+        """category_histograms counts each author's articles per category"""
+        authors, magazines = synthetic_graph
+        engine = VectorEngine(authors, magazines)
+        histograms = engine.category_histograms()
+        for row, author in enumerate(authors):
+            for column, category in enumerate(engine.categories):
+                expected = sum(1 for article in author.articles() if article.magazine.category == category)
+                assert histograms[row, column] == expected
+
+    def test_empty_graph(self):
+        """an engine over magazines without articles returns empty results"""
+        magazine = Magazine("Vogue", "Fashion")
+        engine = VectorEngine([Author("Carry Bradshaw")], [magazine])
+        assert engine.top_publisher() is None
+        assert engine.contributing_authors() == {magazine: None}